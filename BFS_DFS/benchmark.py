@@ -0,0 +1,41 @@
+import time
+
+import numpy as np
+
+from task3_batch_distribution import batch_distribute_coins
+from task3_coin_distribution import distribute_coins
+
+
+def random_requests(n, seed=0):
+    """Random (total amount, cashiers) requests that divide evenly."""
+    rng = np.random.default_rng(seed)
+    cashiers = rng.integers(1, 20, size=n, dtype=np.int64)
+    amounts = rng.integers(1, 100_000, size=n, dtype=np.int64)
+    return amounts * cashiers, cashiers
+
+
+def main(sizes=(10 ** 4, 10 ** 5, 10 ** 6), denominations=(50, 25, 10, 5, 1)):
+    print(f"Denominations: {list(denominations)}")
+    print(f"{'N':<10} {'per-call loop (s)':<20} {'batch (s)':<12} Speedup")
+    print("-" * 52)
+    for n in sizes:
+        totals, cashiers = random_requests(n)
+
+        start = time.perf_counter()
+        expected = [distribute_coins(t, c, denominations)
+                    for t, c in zip(totals.tolist(), cashiers.tolist())]
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        counts = batch_distribute_coins(totals, cashiers, denominations)
+        batch_time = time.perf_counter() - start
+
+        if counts.tolist() != [list(d.values()) for d in expected]:
+            raise AssertionError(f"Batch result differs from distribute_coins for N = {n}")
+        print(f"{n:<10} {loop_time:<20.3f} {batch_time:<12.4f} {loop_time / batch_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
+    print()
+    main(denominations=(4, 3, 1))
@@ -0,0 +1,101 @@
+import numpy as np
+
+from task3_coin_distribution import (US_DENOMINATIONS, dp_bound, is_canonical, make_change,
+                                     normalize_denominations)
+
+
+def _whole_numbers(values: np.ndarray, name: str):
+    # int64 copy of values and a mask of the entries that are not whole
+    # numbers (those become 0); floats must hold whole numbers, as the
+    # divisibility check of distribute_coins requires
+    if values.dtype.kind in 'iu':
+        return values.astype(np.int64), np.zeros(values.shape, dtype=bool)
+    if values.dtype.kind == 'f':
+        fractional = ~np.isfinite(values) | (values != np.floor(values))
+        return np.where(fractional, 0, values).astype(np.int64), fractional
+    raise ValueError(f"{name} must be integers, not {values.dtype}")
+
+
+def batch_distribute_coins(total_amounts, num_cashiers, denominations=US_DENOMINATIONS) -> np.ndarray:
+    """
+    Distributes coins for many (total amount, cashiers) requests at once.
+
+    Validation and the per-cashier amounts are computed for the whole batch
+    with array operations. Canonical systems then run the greedy as one
+    vectorized divmod per denomination. Other systems reduce every amount
+    with the largest coin and look up the few distinct remainders with
+    make_change.
+
+    Args:
+        total_amounts: 1-D array of total amounts in cents, or one amount
+        num_cashiers: Array of cashier counts (or one count for every request)
+        denominations: Available coin denominations in cents (U.S. coins by default)
+
+    Returns:
+        np.ndarray: (N x D) int64 coin counts per cashier, one row per request
+        and one column per denomination, largest denomination first
+
+    Raises:
+        ValueError: If any request is invalid or can't be distributed equally;
+        the message names the first such request
+    """
+    totals = np.atleast_1d(np.asarray(total_amounts))
+    if totals.ndim != 1:
+        raise ValueError(f"Total amounts must be a scalar or a 1-D array, not {totals.ndim}-D")
+    totals, fractional_totals = _whole_numbers(totals, "Total amounts")
+    cashiers, fractional_cashiers = _whole_numbers(
+        np.broadcast_to(np.asarray(num_cashiers), totals.shape), "Numbers of cashiers")
+    denominations = normalize_denominations(denominations)
+
+    # Input validation: every check runs over the whole batch, and the
+    # earliest failing request is reported with the first check it fails
+    positive = (totals > 0) & (cashiers > 0)
+    amounts, leftover = np.divmod(totals, np.where(positive, cashiers, 1))
+    checks = [
+        (fractional_totals, "Total amounts must be whole numbers"),
+        (fractional_cashiers, "Numbers of cashiers must be whole numbers"),
+        (~positive, "Total amount and number of cashiers must be positive"),
+        (leftover != 0, "Total amount must be evenly divisible by number of cashiers"),
+    ]
+    invalid = np.flatnonzero(np.logical_or.reduce([mask for mask, _ in checks]))
+    if len(invalid):
+        request = invalid[0]
+        message = next(message for mask, message in checks if mask[request])
+        raise ValueError(f"{message} (request {request})")
+
+    counts = np.empty((len(amounts), len(denominations)), dtype=np.int64)
+    if is_canonical(denominations):
+        # Greedy coin selection, one denomination at a time
+        remaining = amounts
+        for column, denomination in enumerate(denominations):
+            counts[:, column], remaining = np.divmod(remaining, denomination)
+        return counts
+
+    # Bounded DP: take coins of the largest denomination down to the table
+    # bound, then solve each distinct remainder once
+    largest = denominations[0]
+    bound = dp_bound(denominations)
+    large_coins = np.where(amounts > bound, (amounts - bound) // largest + 1, 0)
+    remainders, inverse = np.unique(amounts - large_coins * largest, return_inverse=True)
+    rows = []
+    failed = []
+    for position, remainder in enumerate(remainders.tolist()):
+        try:
+            rows.append(make_change(remainder, denominations))
+        except ValueError:
+            failed.append(position)
+    if failed:
+        # Remainders are sorted, so look up the earliest request among all failures
+        request = np.flatnonzero(np.isin(inverse.reshape(-1), failed))[0]
+        raise ValueError(f"Amount {amounts[request]} cannot be made from denominations "
+                         f"{list(denominations)} (request {request})")
+    table = np.array(rows, dtype=np.int64).reshape(len(remainders), len(denominations))
+    counts[:] = table[inverse.reshape(-1)]
+    counts[:, 0] += large_coins
+    return counts
+
+
+if __name__ == "__main__":
+    totals = np.array([1000, 15675, 125, 1791])
+    cashiers = np.array([4, 3, 5, 3])
+    print(batch_distribute_coins(totals, cashiers))
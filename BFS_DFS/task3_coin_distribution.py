@@ -1,10 +1,135 @@
-def distribute_coins(total_amount: int, num_cashiers: int) -> dict:
+from functools import lru_cache
+
+# Standard U.S. coin denominations in cents (largest to smallest)
+US_DENOMINATIONS = (50, 25, 10, 5, 1)
+
+# Number of distinct (system, amount) answers kept by the change cache
+CHANGE_CACHE_SIZE = 4096
+
+# Min-coin DP tables for non-canonical systems, grown on demand
+_dp_tables = {}
+
+
+def normalize_denominations(denominations) -> tuple:
+    """
+    Validates a coin system and returns it as a tuple sorted largest first.
+
+    Raises:
+        ValueError: If the system is empty or has a non-positive denomination
+    """
+    system = tuple(sorted(set(denominations), reverse=True))
+    if not system:
+        raise ValueError("At least one denomination is required")
+    if any(not isinstance(d, int) or d <= 0 for d in system):
+        raise ValueError("Denominations must be positive integers")
+    return system
+
+
+def _greedy(denominations: tuple, amount: int) -> tuple:
+    # Coin counts of the greedy change, in the order of denominations
+    counts = []
+    for denomination in denominations:
+        counts.append(amount // denomination)
+        amount %= denomination
+    return tuple(counts)
+
+
+@lru_cache(maxsize=None)
+def is_canonical(denominations: tuple) -> bool:
+    """
+    Checks whether greedy change is optimal for every amount in a coin system.
+
+    Uses Pearson's O(d^3) test: if greedy ever fails, the smallest failing
+    amount comes from taking the greedy change of c[i-1] - 1, keeping its
+    first j - 1 counts, adding one coin of c[j] and dropping the rest. The
+    result is cached, so each system is tested once.
+
+    Args:
+        denominations: Coin system as returned by normalize_denominations
+    """
+    # Systems without a 1 cannot make every amount, so greedy is never trusted
+    if denominations[-1] != 1:
+        return False
+
+    for i in range(1, len(denominations)):
+        base = _greedy(denominations, denominations[i - 1] - 1)
+        for j in range(i, len(denominations)):
+            counts = base[:j] + (base[j] + 1,)
+            amount = sum(c * d for c, d in zip(counts, denominations))
+            if sum(_greedy(denominations, amount)) > sum(counts):
+                return False
+    return True
+
+
+def dp_bound(denominations: tuple) -> int:
     """
-    Distributes coins among cashiers using a greedy approach to minimize total coins used.
+    Largest amount the min-coin DP table needs for a coin system: c1 * c2 + c1
+    for the two largest coins c1 and c2.
+    """
+    largest = denominations[0]
+    second = denominations[1] if len(denominations) > 1 else 0
+    return largest * second + largest
+
+
+def _dp_table(denominations: tuple, limit: int) -> tuple:
+    """
+    Min-coin table for amounts 0..limit, extended in place when a larger
+    limit is requested. Each entry also keeps the last coin used, so the
+    change itself can be rebuilt.
+    """
+    best, last = _dp_tables.setdefault(denominations, ([0], [0]))
+    for amount in range(len(best), limit + 1):
+        fewest, coin = float('inf'), 0
+        for denomination in denominations:
+            if denomination <= amount and best[amount - denomination] + 1 < fewest:
+                fewest, coin = best[amount - denomination] + 1, denomination
+        best.append(fewest)
+        last.append(coin)
+    return best, last
+
+
+@lru_cache(maxsize=CHANGE_CACHE_SIZE)
+def make_change(amount: int, denominations: tuple = US_DENOMINATIONS) -> tuple:
+    """
+    Fewest-coins change for an amount, as counts in the order of denominations.
+
+    Canonical systems use the O(d) greedy. Other systems use a DP table
+    bounded by c1 * c2 + c1 for the two largest coins c1 and c2: an optimal
+    change never needs c1 or more smaller coins, so larger amounts are
+    reduced with coins of c1 first. Results are cached, so repeated amounts
+    cost O(1).
+
+    Raises:
+        ValueError: If the amount cannot be made from the denominations
+    """
+    if is_canonical(denominations):
+        return _greedy(denominations, amount)
+
+    largest = denominations[0]
+    bound = dp_bound(denominations)
+    large_coins = (amount - bound) // largest + 1 if amount > bound else 0
+    remaining = amount - large_coins * largest
+
+    best, last = _dp_table(denominations, remaining)
+    if best[remaining] == float('inf'):
+        raise ValueError(f"Amount {amount} cannot be made from denominations {list(denominations)}")
+
+    counts = dict.fromkeys(denominations, 0)
+    counts[largest] += large_coins
+    while remaining:
+        counts[last[remaining]] += 1
+        remaining -= last[remaining]
+    return tuple(counts.values())
+
+
+def distribute_coins(total_amount: int, num_cashiers: int, denominations=US_DENOMINATIONS) -> dict:
+    """
+    Distributes coins among cashiers, using the fewest coins per cashier.
     
     Args:
         total_amount: Total amount to distribute in cents
         num_cashiers: Number of cashiers to distribute among
+        denominations: Available coin denominations in cents (U.S. coins by default)
     
     Returns:
         dict: Distribution of coins per cashier with coin counts
@@ -19,24 +144,16 @@ def distribute_coins(total_amount: int, num_cashiers: int) -> dict:
     if total_amount % num_cashiers != 0:
         raise ValueError("Total amount must be evenly divisible by number of cashiers")
     
-    # Available coin denominations in cents (largest to smallest)
-    denominations = [50, 25, 10, 5, 1]
+    # Coin system, largest to smallest
+    denominations = normalize_denominations(denominations)
     
     # Calculate amount per cashier
     amount_per_cashier = total_amount // num_cashiers
     
-    # Initialize result dictionary
-    distribution = {d: 0 for d in denominations}
-    remaining = amount_per_cashier
-    
-    # Greedy coin selection
-    for denomination in denominations:
-        if remaining >= denomination:
-            num_coins = remaining // denomination
-            distribution[denomination] = num_coins
-            remaining = remaining % denomination
+    # Greedy for canonical systems, bounded DP otherwise
+    counts = make_change(amount_per_cashier, denominations)
     
-    return distribution
+    return dict(zip(denominations, counts))
 
 def print_distribution(distribution: dict) -> None:
     """
@@ -68,6 +185,12 @@ def main():
         distribution = distribute_coins(total_amount, num_cashiers)
         print_distribution(distribution)
         
+        # A custom token set where greedy change is not optimal
+        tokens = (4, 3, 1)
+        print(f"\nDistributing {6 * num_cashiers} cents in tokens {list(tokens)}")
+        distribution = distribute_coins(6 * num_cashiers, num_cashiers, tokens)
+        print_distribution(distribution)
+        
     except ValueError as e:
         print(f"Error: {e}")
 
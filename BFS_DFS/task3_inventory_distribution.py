@@ -0,0 +1,335 @@
+from itertools import islice
+
+import numpy as np
+
+from task3_coin_distribution import normalize_denominations, print_distribution
+
+# DP value for amounts that cannot be made
+UNREACHABLE = np.iinfo(np.int64).max // 2
+
+# Most coin vectors per cashier the exact split search will consider
+MAX_PATTERNS = 100000
+# Search states the joint split visits before settling for its best plan
+MAX_STATES = 10000
+# Prices per coin of a denomination subset tried by the joint split's bound
+PRICES = np.array([0, 1 / 8, 1 / 4, 1 / 3, 1 / 2, 2 / 3, 1, 3 / 2, 2, 3, 4, 8])
+
+
+def _split_counts(denominations: tuple, counts: list, amount: int) -> list:
+    """
+    Binary splitting of bounded coin counts into 0/1 items.
+
+    Up to c coins of one denomination become items of 1, 2, 4, ... coins plus
+    a remainder, so every count from 0 to c is a sum of distinct items and a
+    denomination costs O(log c) items instead of c.
+
+    Returns:
+        list: (denomination, coins) pairs, one per item
+    """
+    items = []
+    for denomination, count in zip(denominations, counts):
+        # More than amount // denomination coins can never be used
+        count = min(count, amount // denomination)
+        chunk = 1
+        while count > 0:
+            coins = min(chunk, count)
+            items.append((denomination, coins))
+            count -= coins
+            chunk *= 2
+    return items
+
+
+def fewest_coins_bounded(amount: int, denominations: tuple, counts: list):
+    """
+    Fewest coins making exactly amount with at most counts[i] coins of
+    denominations[i].
+
+    A 0/1 knapsack over the binary-split items, one vectorized pass per item,
+    in O(amount * sum(log c)) time.
+
+    Returns:
+        list: Coins used per denomination, or None if the amount cannot be made
+    """
+    items = _split_counts(denominations, counts, amount)
+
+    best = np.full(amount + 1, UNREACHABLE, dtype=np.int64)
+    best[0] = 0
+    taken = np.zeros((len(items), amount + 1), dtype=bool)
+    for i, (denomination, coins) in enumerate(items):
+        weight = denomination * coins
+        candidate = best[:-weight] + coins
+        improved = candidate < best[weight:]
+        best[weight:][improved] = candidate[improved]
+        taken[i, weight:] = improved
+
+    if best[amount] >= UNREACHABLE:
+        return None
+
+    # Walk the items backwards to recover which ones were used
+    used = dict.fromkeys(denominations, 0)
+    remaining = amount
+    for i in range(len(items) - 1, -1, -1):
+        if taken[i, remaining]:
+            denomination, coins = items[i]
+            used[denomination] += coins
+            remaining -= denomination * coins
+    return list(used.values())
+
+
+def _patterns(amount: int, denominations: tuple, counts: list):
+    """
+    Yields every coin vector that pays amount within counts, in decreasing
+    lexicographic order (most large coins first).
+    """
+    n = len(denominations)
+    # reach[i]: the most the coins from denominations[i] onwards can pay
+    reach = [0] * (n + 1)
+    for i in range(n - 1, -1, -1):
+        reach[i] = reach[i + 1] + counts[i] * denominations[i]
+    pattern = [0] * n
+
+    def fill(i, left):
+        if left == 0:
+            yield tuple(pattern[:i]) + (0,) * (n - i)
+            return
+        if i == n or reach[i] < left:
+            return
+        denomination = denominations[i]
+        for coins in range(min(counts[i], left // denomination), -1, -1):
+            pattern[i] = coins
+            yield from fill(i + 1, left - coins * denomination)
+        pattern[i] = 0
+
+    yield from fill(0, amount)
+
+
+def _fewest_coins_jointly(amount: int, num_cashiers: int, denominations: tuple, counts: list,
+                          plan: list = None):
+    """
+    Fewest coins in total that pay each of num_cashiers exactly amount from
+    one shared inventory.
+
+    Cashiers are interchangeable, so a split is fixed by how many cashiers
+    get each coin vector (pattern). Patterns are sorted by coin count and
+    an iterative branch and bound gives each one a multiplicity in turn.
+    plan, a known valid allocation, seeds the best total.
+
+    Every subset S of the denominations gives two weights of a pattern: its
+    coins from S and its cents from S. The remaining cashiers need at
+    least the least weight of any remaining pattern each, and
+    multiplicities that leave less than that in the inventory are dropped.
+    Pricing a weight at p coins per unit, r cashiers pay at least r times
+    the least size + p * weight, minus p times the weight left, so the
+    best of the PRICES bounds every completion. Multiplicities are tried
+    cheapest bound first, and a branch stops once its bound cannot beat
+    the best plan. After a state (pattern index, remaining inventory) has
+    been searched, the fewest coins its completion could still need is
+    remembered, and the state is skipped when it comes up again without
+    room to improve.
+
+    Splitting coins into equal shares is NP-hard, so the search is capped.
+    When one cashier's amount can be paid in more than MAX_PATTERNS ways,
+    or MAX_STATES states have been searched, the best plan so far is
+    returned unproven, or ValueError is raised if there is none.
+
+    Returns:
+        list: One coin vector per cashier, or None if no allocation exists
+    """
+    patterns = list(islice(_patterns(amount, denominations, counts), MAX_PATTERNS + 1))
+    if len(patterns) > MAX_PATTERNS:
+        if plan is not None:
+            return plan
+        raise ValueError(f"Too many ways to pay {amount} cents from the inventory "
+                         f"to search for an equal split")
+    patterns.sort(key=sum)
+    sizes = [sum(pattern) for pattern in patterns]
+    last = len(patterns) - 1
+
+    # Each row of weights counts either the coins or the cents a coin vector
+    # takes from one subset of the denominations; uses[i, w]: weight w of
+    # pattern i
+    num_denominations = len(denominations)
+    subsets = np.array([[(mask >> d) & 1 for d in range(num_denominations)]
+                        for mask in range(1, 1 << num_denominations)], dtype=np.int64)
+    weights = np.vstack([subsets, subsets * np.array(denominations, dtype=np.int64)])
+    uses = np.array(patterns, dtype=np.int64).reshape(len(patterns), num_denominations) @ weights.T
+    # need[i, w]: least weight w that any of patterns i.. has;
+    # cheapest[i, w, m]: least size + PRICES[m] * weight w over patterns i..
+    need = np.zeros((len(patterns) + 1, len(weights)), dtype=np.int64)
+    cheapest = np.zeros((len(patterns) + 1, len(weights), len(PRICES)))
+    if patterns:
+        need[:-1] = np.minimum.accumulate(uses[::-1])[::-1]
+        priced = np.array(sizes, dtype=np.int64)[:, None, None] + uses[:, :, None] * PRICES
+        cheapest[:-1] = np.minimum.accumulate(priced[::-1])[::-1]
+
+    best_coins = sum(map(sum, plan)) if plan else float('inf')
+    best_taken = None
+    remaining = list(counts)
+    taken = [0] * len(patterns)
+    # (pattern index, remaining inventory) -> lower bound on completion coins
+    explored = {}
+
+    def choices(i, cashiers_left, coins_so_far):
+        # Multiplicities for pattern i that leave a feasible rest, paired
+        # with a lower bound on the total coins and cheapest bound first.
+        # The last pattern must take every remaining cashier.
+        most = cashiers_left
+        for available, coins in zip(remaining, patterns[i]):
+            if coins:
+                most = min(most, available // coins)
+        if i == last:
+            return iter([(most, coins_so_far + most * sizes[i])] if most == cashiers_left else [])
+        counts = np.arange(most, -1, -1)
+        left = cashiers_left - counts
+        # available[c, w]: weight w left in the inventory after c copies of
+        # pattern i
+        available = weights @ remaining - counts[:, None] * uses[i]
+        feasible = np.all(left[:, None] * need[i + 1] <= available, axis=1)
+        # Pricing weight w at p coins per unit, the other cashiers pay at
+        # least cheapest[i + 1] each, less p times the w that is left
+        rest = (left[:, None, None] * cheapest[i + 1]
+                - available[:, :, None] * PRICES).max(axis=(1, 2))
+        # Coin counts are whole, so a fractional bound rounds up
+        lower = coins_so_far + counts * sizes[i] + np.ceil(rest - 1e-9).astype(np.int64)
+        order = np.argsort(lower[feasible], kind='stable')
+        return zip(counts[feasible][order].tolist(), lower[feasible][order].tolist())
+
+    def enter(i, cashiers_left, coins_so_far):
+        state = (i, tuple(remaining))
+        if coins_so_far + explored.get(state, 0) >= best_coins:
+            return
+        explored.setdefault(state, 0)
+        stack.append([i, cashiers_left, coins_so_far, choices(i, cashiers_left, coins_so_far), state])
+
+    def leave():
+        _, _, coins_so_far, _, state = stack.pop()
+        explored[state] = best_coins - coins_so_far
+
+    # Frames: [pattern index, cashiers left, coins so far, multiplicities, state]
+    stack = []
+    if patterns:
+        enter(0, num_cashiers, 0)
+    while stack and len(explored) <= MAX_STATES:
+        i, cashiers_left, coins_so_far, options, _ = stack[-1]
+        # Undo this pattern's previous multiplicity
+        if taken[i]:
+            for j, coins in enumerate(patterns[i]):
+                remaining[j] += taken[i] * coins
+            taken[i] = 0
+
+        count, lower = next(options, (None, None))
+        # Options come cheapest bound first, so the rest cannot do better
+        if count is None or lower >= best_coins:
+            leave()
+            continue
+
+        taken[i] = count
+        for j, pattern_coins in enumerate(patterns[i]):
+            remaining[j] -= count * pattern_coins
+        left = cashiers_left - count
+        coins = coins_so_far + count * sizes[i]
+        if left == 0:
+            best_coins, best_taken = coins, taken[:]
+        else:
+            enter(i + 1, left, coins)
+
+    if best_taken is None:
+        if stack and plan is None:
+            raise ValueError(f"No equal split among {num_cashiers} cashiers found "
+                             f"within {MAX_STATES} search states")
+        return plan
+    return [pattern for pattern, count in zip(patterns, best_taken) for _ in range(count)]
+
+
+def distribute_coins_from_inventory(total_amount: int, num_cashiers: int, inventory: dict) -> list:
+    """
+    Distributes coins among cashiers from a vault with a limited supply of
+    each denomination, using the fewest coins in total.
+
+    Every cashier receives exactly total_amount / num_cashiers. Cashiers are
+    first served in turn, each with the fewest coins the remaining inventory
+    allows (a bounded knapsack). When that plan uses as few coins as paying
+    the whole total at once would, it is optimal and returned. Otherwise a
+    search over the joint allocation, seeded with the plan, finds the
+    optimum or proves that no allocation exists. That search is capped
+    (see _fewest_coins_jointly); past the cap the best plan found is
+    returned even if it is not proven optimal.
+
+    Args:
+        total_amount: Total amount to distribute in cents
+        num_cashiers: Number of cashiers to distribute among
+        inventory: Number of coins available per denomination in cents
+
+    Returns:
+        list: One distribution dict (denomination -> coin count) per cashier
+
+    Raises:
+        ValueError: If inputs are invalid or the inventory cannot pay every
+        cashier the exact amount
+    """
+    # Input validation
+    if total_amount <= 0 or num_cashiers <= 0:
+        raise ValueError("Total amount and number of cashiers must be positive")
+
+    if total_amount % num_cashiers != 0:
+        raise ValueError("Total amount must be evenly divisible by number of cashiers")
+
+    if any(count < 0 for count in inventory.values()):
+        raise ValueError("Coin counts in the inventory cannot be negative")
+
+    denominations = normalize_denominations(inventory)
+    counts = [inventory[d] for d in denominations]
+
+    if sum(c * d for c, d in zip(counts, denominations)) < total_amount:
+        raise ValueError("Inventory holds less than the total amount")
+
+    # Calculate amount per cashier
+    amount_per_cashier = total_amount // num_cashiers
+
+    # Fewest coins for the whole total: no split can use fewer
+    lower_bound = fewest_coins_bounded(total_amount, denominations, counts)
+    if lower_bound is None:
+        raise ValueError(f"Inventory cannot make the total of {total_amount} cents exactly")
+
+    # Fast path: serve cashiers in turn
+    plan = []
+    remaining = counts
+    for _ in range(num_cashiers):
+        used = fewest_coins_bounded(amount_per_cashier, denominations, remaining)
+        if used is None:
+            plan = None
+            break
+        remaining = [r - u for r, u in zip(remaining, used)]
+        plan.append(tuple(used))
+
+    if plan is None or sum(map(sum, plan)) > sum(lower_bound):
+        plan = _fewest_coins_jointly(amount_per_cashier, num_cashiers, denominations, counts, plan)
+        if plan is None:
+            raise ValueError(f"Inventory cannot pay each of {num_cashiers} cashiers "
+                             f"exactly {amount_per_cashier} cents")
+
+    return [dict(zip(denominations, used)) for used in plan]
+
+
+def main():
+    """
+    Main function to demonstrate distribution from a limited coin inventory.
+    """
+    try:
+
+        total_amount = 1000  # $10.00 in cents
+        num_cashiers = 4
+        inventory = {50: 10, 25: 8, 10: 20, 5: 10, 1: 100}
+
+        print(f"\nDistributing ${total_amount/100:.2f} among {num_cashiers} cashiers")
+        print(f"Inventory: {inventory}")
+
+        for distribution in distribute_coins_from_inventory(total_amount, num_cashiers, inventory):
+            print_distribution(distribution)
+
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import math
+import random
+
+from counting_inversions import countInversions
+
+
+def positionMap(B):
+    # Build once per global ranking and reuse it for every request
+    return {movie: idx for idx, movie in enumerate(B)}
+
+
+def sampleSize(epsilon, confidence):
+    # Hoeffding bound: this many pairs keep the inverted fraction within
+    # epsilon of the truth with the requested confidence, independent of N
+    return math.ceil(math.log(2 / (1 - confidence)) / (2 * epsilon ** 2))
+
+
+def approxCountInversions(A, B_positions, N, epsilon=0.01, confidence=0.95, rng=None):
+    """
+    Estimate the number of inversions between A and the global ranking by
+    sampling random pairs of positions.
+
+    Only the sampled movies are looked up in B_positions, so the cost is
+    O(log(1 / (1 - confidence)) / epsilon^2) and does not grow with N.
+
+    Returns (estimate, lower, upper). With probability at least `confidence`
+    the exact count lies in [lower, upper], an interval whose half-width is
+    epsilon * N * (N - 1) / 2.
+    """
+    total_pairs = N * (N - 1) // 2
+    if total_pairs == 0:
+        return 0, 0, 0
+
+    rng = rng or random.Random()
+    samples = sampleSize(epsilon, confidence)
+
+    # Step 1: Sample pairs of positions and test each one for an inversion
+    inverted = 0
+    for _ in range(samples):
+        i, j = rng.sample(range(N), 2)
+        if i > j:
+            i, j = j, i
+        if B_positions[A[i]] > B_positions[A[j]]:
+            inverted += 1
+
+    # Step 2: Scale the inverted fraction up to all pairs
+    fraction = inverted / samples
+    half_width = math.sqrt(math.log(2 / (1 - confidence)) / (2 * samples))
+    estimate = round(fraction * total_pairs)
+    lower = max(0, math.floor((fraction - half_width) * total_pairs))
+    upper = min(total_pairs, math.ceil((fraction + half_width) * total_pairs))
+    return estimate, lower, upper
+
+
+if __name__ == "__main__":
+    N = 100000
+    B = list(range(N))
+    A = B[:]
+    random.Random(1).shuffle(A)
+
+    B_positions = positionMap(B)
+    estimate, lower, upper = approxCountInversions(A, B_positions, N, rng=random.Random(7))
+    print(f"Approximate inversions: {estimate} (95% interval {lower} - {upper})")
+    print(f"Exact inversions:       {countInversions(A, B, N)}")
@@ -0,0 +1,153 @@
+from bisect import bisect_left, bisect_right, insort
+from math import isqrt
+
+from counting_inversions import countInversions
+
+
+class DynamicInversions:
+    """
+    Keeps the inversion count of a user ranking up to date while movies are
+    swapped, moved, inserted or removed.
+
+    The transformed ranking (positions in B) is split into blocks of about
+    sqrt(N log N) entries. Every block stores its entries in ranking order and
+    as a sorted copy, so counting the entries greater or smaller than a value
+    costs one bisect per block plus a scan of a single partial block.
+    Each update therefore runs in O(sqrt(N log N)) time.
+    """
+
+    def __init__(self, A, B, N):
+        self.B = list(B)
+        self.B_positions = {movie: idx for idx, movie in enumerate(B)}
+        A_transformed = [self.B_positions[movie] for movie in A]
+
+        self.inversions = countInversions(A, B, N)
+        self.size = N
+        self.block_size = max(16, isqrt(N * max(1, N.bit_length())))
+
+        self._blocks = [
+            A_transformed[i:i + self.block_size]
+            for i in range(0, N, self.block_size)
+        ]
+        self._sorted = [sorted(block) for block in self._blocks]
+
+    def __len__(self):
+        return self.size
+
+    def ranking(self):
+        """Return the current user ranking as a list of movie IDs."""
+        return [self.B[rank] for block in self._blocks for rank in block]
+
+    def swap(self, i, j):
+        """Swap the movies at positions i and j. Returns the inversion delta."""
+        self._check_position(i)
+        self._check_position(j)
+        if i == j:
+            return 0
+        lo, hi = min(i, j), max(i, j)
+        high_value, delta = self._take(hi)
+        low_value, removed = self._take(lo)
+        delta += removed
+        delta += self._put(lo, high_value)
+        delta += self._put(hi, low_value)
+        return delta
+
+    def move(self, src, dst):
+        """
+        Move the movie at position src so that it ends up at position dst.
+        Returns the inversion delta.
+        """
+        self._check_position(src)
+        self._check_position(dst)
+        value, delta = self._take(src)
+        return delta + self._put(dst, value)
+
+    def insert(self, pos, movie):
+        """Insert a movie at position pos. Returns the inversion delta."""
+        if not 0 <= pos <= self.size:
+            raise IndexError(f"Position {pos} out of range")
+        if movie not in self.B_positions:
+            raise ValueError(f"Movie {movie} is not in the global ranking")
+        return self._put(pos, self.B_positions[movie])
+
+    def remove(self, pos):
+        """Remove the movie at position pos. Returns the inversion delta."""
+        self._check_position(pos)
+        _, delta = self._take(pos)
+        return delta
+
+    def _check_position(self, pos):
+        if not 0 <= pos < self.size:
+            raise IndexError(f"Position {pos} out of range")
+
+    def _locate(self, pos):
+        # Find the block holding position pos and the offset inside it
+        for b, block in enumerate(self._blocks):
+            if pos < len(block):
+                return b, pos
+            pos -= len(block)
+        return len(self._blocks) - 1, len(self._blocks[-1])
+
+    def _pairs_with(self, value, pos):
+        # Inversions formed by value if it sat at position pos:
+        # greater entries before it plus smaller entries after it
+        count = 0
+        seen = 0
+        for block, ordered in zip(self._blocks, self._sorted):
+            size = len(block)
+            if seen + size <= pos:
+                count += size - bisect_right(ordered, value)
+            elif seen >= pos:
+                count += bisect_left(ordered, value)
+            else:
+                cut = pos - seen
+                count += sum(1 for x in block[:cut] if x > value)
+                count += sum(1 for x in block[cut:] if x < value)
+            seen += size
+        return count
+
+    def _take(self, pos):
+        b, offset = self._locate(pos)
+        block = self._blocks[b]
+        ordered = self._sorted[b]
+        value = block.pop(offset)
+        ordered.pop(bisect_left(ordered, value))
+        if not block:
+            del self._blocks[b]
+            del self._sorted[b]
+        self.size -= 1
+
+        delta = -self._pairs_with(value, pos)
+        self.inversions += delta
+        return value, delta
+
+    def _put(self, pos, value):
+        delta = self._pairs_with(value, pos)
+        self.inversions += delta
+
+        if not self._blocks:
+            self._blocks.append([])
+            self._sorted.append([])
+        b, offset = self._locate(pos)
+        block = self._blocks[b]
+        block.insert(offset, value)
+        insort(self._sorted[b], value)
+        self.size += 1
+
+        # Split oversized blocks to keep the per-update bound
+        if len(block) > 2 * self.block_size:
+            half = len(block) // 2
+            self._blocks[b:b + 1] = [block[:half], block[half:]]
+            self._sorted[b:b + 1] = [sorted(block[:half]), sorted(block[half:])]
+        return delta
+
+
+if __name__ == "__main__":
+    A = [3, 1, 2]
+    B = [2, 3, 1]
+    N = 3
+
+    ranking = DynamicInversions(A, B, N)
+    print(ranking.inversions)  # Output: 2
+    print(ranking.swap(0, 2))  # Output: -1 (A becomes [2, 1, 3])
+    print(ranking.inversions)  # Output: 1
@@ -0,0 +1,135 @@
+import mmap
+import os
+import random
+from array import array
+
+from counting_inversions import countInversions
+
+
+def writeRankingFile(path, ranking):
+    # Rankings are stored as raw native-endian int32 movie IDs
+    with open(path, 'wb') as f:
+        array('i', ranking).tofile(f)
+
+
+class RankingFileCounter:
+    """
+    Counts inversions between two binary int32 ranking files without building
+    Python lists or dicts.
+
+    Both files are memory-mapped. The movie -> position map is a dense int32
+    array indexed by movie ID, so IDs must lie in 0..N-1. Two int32 buffers
+    are allocated once and reused across calls: one holds the position map
+    and later serves as merge scratch space, the other holds A_transformed.
+    A fresh one-byte-per-movie marker records which movies B lists, so both
+    files must be permutations of 0..N-1 and nothing stale from an earlier
+    call is read. Peak memory is therefore about 9 bytes per movie plus the
+    mapped files.
+    """
+
+    def __init__(self):
+        self._positions = array('i')
+        self._transformed = array('i')
+
+    def _reserve(self, N):
+        # Grow the reusable buffers only when a larger ranking arrives
+        if len(self._positions) < N:
+            self._positions = array('i', [0]) * N
+            self._transformed = array('i', [0]) * N
+
+    def count(self, a_path, b_path):
+        with open(a_path, 'rb') as fa, open(b_path, 'rb') as fb:
+            size = os.fstat(fa.fileno()).st_size
+            if size != os.fstat(fb.fileno()).st_size:
+                raise ValueError("Ranking files must have the same length")
+            if size % 4:
+                raise ValueError("Ranking files must contain int32 values")
+            N = size // 4
+            if N == 0:
+                return 0
+
+            self._reserve(N)
+            positions = self._positions
+            A_transformed = self._transformed
+            # 0: not in B, 1: in B, 2: in B and already seen in A
+            seen = bytearray(N)
+
+            with mmap.mmap(fa.fileno(), 0, access=mmap.ACCESS_READ) as a_map, \
+                    mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ) as b_map:
+                A = memoryview(a_map).cast('i')
+                B = memoryview(b_map).cast('i')
+                try:
+                    # Step 1: Dense position map over B
+                    for idx in range(N):
+                        movie = B[idx]
+                        if not 0 <= movie < N:
+                            raise ValueError(f"Movie ID {movie} outside 0..{N - 1}")
+                        if seen[movie]:
+                            raise ValueError(f"Movie ID {movie} appears twice in B")
+                        seen[movie] = 1
+                        positions[movie] = idx
+
+                    # Step 2: Transform A into positions in B
+                    for idx in range(N):
+                        movie = A[idx]
+                        if not 0 <= movie < N:
+                            raise ValueError(f"Movie ID {movie} outside 0..{N - 1}")
+                        if seen[movie] != 1:
+                            raise ValueError(f"Movie ID {movie} appears twice in A")
+                        seen[movie] = 2
+                        A_transformed[idx] = positions[movie]
+                finally:
+                    A.release()
+                    B.release()
+
+        # Step 3: Bottom-up merge sort; the position map is no longer needed,
+        # so its buffer becomes the scratch array
+        return self._merge_sort_and_count(A_transformed, positions, N)
+
+    @staticmethod
+    def _merge_sort_and_count(src, dst, N):
+        inv_count = 0
+        width = 1
+        while width < N:
+            for left in range(0, N, 2 * width):
+                mid = min(left + width, N)
+                right = min(left + 2 * width, N)
+                i, j, k = left, mid, left
+
+                # Merge both runs from src into dst while counting inversions
+                while i < mid and j < right:
+                    if src[i] <= src[j]:
+                        dst[k] = src[i]
+                        i += 1
+                    else:
+                        dst[k] = src[j]
+                        inv_count += mid - i
+                        j += 1
+                    k += 1
+                dst[k:k + mid - i] = src[i:mid]
+                k += mid - i
+                dst[k:k + right - j] = src[j:right]
+
+            # Swap roles instead of copying the merged data back
+            src, dst = dst, src
+            width *= 2
+        return inv_count
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    N = 100000
+    B = list(range(N))
+    A = B[:]
+    random.Random(1).shuffle(A)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        a_path = os.path.join(tmp, 'A.bin')
+        b_path = os.path.join(tmp, 'B.bin')
+        writeRankingFile(a_path, A)
+        writeRankingFile(b_path, B)
+
+        counter = RankingFileCounter()
+        print(counter.count(a_path, b_path))
+        print(countInversions(A, B, N))
@@ -0,0 +1,119 @@
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from counting_inversions import countInversions, merge_and_count, merge_sort_and_count
+
+# Shared memory blocks attached once per worker process
+_shared = {}
+
+
+def _attach(arr_name, temp_name):
+    _shared['arr'] = shared_memory.SharedMemory(name=arr_name)
+    _shared['temp'] = shared_memory.SharedMemory(name=temp_name)
+
+
+def _with_views(func, *bounds):
+    # Cast the raw buffers to int32 views for the duration of one task only,
+    # so no exported views are left behind when the worker shuts down
+    arr = _shared['arr'].buf.cast('i')
+    temp_arr = _shared['temp'].buf.cast('i')
+    try:
+        return func(arr, temp_arr, *bounds)
+    finally:
+        arr.release()
+        temp_arr.release()
+
+
+def _sort_chunk(left, right):
+    return _with_views(merge_sort_and_count, left, right)
+
+
+def _merge_runs(left, mid, right):
+    return _with_views(merge_and_count, left, mid, right)
+
+
+def parallelCountInversions(A, B, N, workers=None):
+    """
+    Count inversions with P worker processes.
+
+    A_transformed is written once into shared memory as int32 and split into
+    P chunks. Each worker sorts its chunk in place while counting the
+    within-chunk inversions, then adjacent sorted runs are merged pairwise,
+    level by level, adding the cross-chunk inversions. The result is exactly
+    the serial count.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or N < 2 * workers:
+        return countInversions(A, B, N)
+
+    # Step 1: Transform A into int32 positions in B inside shared memory
+    B_positions = {movie: idx for idx, movie in enumerate(B)}
+    A_transformed = array('i', (B_positions[movie] for movie in A))
+
+    size = N * A_transformed.itemsize
+    arr_shm = shared_memory.SharedMemory(create=True, size=size)
+    temp_shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        arr_shm.buf[:size] = A_transformed.tobytes()
+        del A_transformed
+
+        # Step 2: Chunk boundaries, one run per worker
+        bounds = [N * p // workers for p in range(workers + 1)]
+        runs = [(bounds[p], bounds[p + 1] - 1) for p in range(workers)]
+
+        with ProcessPoolExecutor(workers, initializer=_attach,
+                                 initargs=(arr_shm.name, temp_shm.name)) as pool:
+            # Step 3: Sort and count every chunk in parallel
+            inv_count = sum(pool.map(_sort_chunk, *zip(*runs)))
+
+            # Step 4: Merge adjacent runs level by level, counting cross-chunk pairs
+            while len(runs) > 1:
+                pairs = [(runs[p], runs[p + 1]) for p in range(0, len(runs) - 1, 2)]
+                futures = [
+                    pool.submit(_merge_runs, left[0], left[1], right[1])
+                    for left, right in pairs
+                ]
+                inv_count += sum(future.result() for future in futures)
+                merged = [(left[0], right[1]) for left, right in pairs]
+                if len(runs) % 2:
+                    merged.append(runs[-1])
+                runs = merged
+
+        return inv_count
+    finally:
+        arr_shm.close()
+        arr_shm.unlink()
+        temp_shm.close()
+        temp_shm.unlink()
+
+
+def benchmark(N=200000, max_workers=32, seed=1):
+    """Time the parallel count from 1 to max_workers workers against the serial count."""
+    B = list(range(N))
+    A = B[:]
+    random.Random(seed).shuffle(A)
+
+    start = time.perf_counter()
+    expected = countInversions(A, B, N)
+    serial_time = time.perf_counter() - start
+    print(f"N = {N}, serial: {serial_time:.3f}s ({expected} inversions)")
+    print("-" * 40)
+    print(f"{'Workers':<10} {'Time (s)':<12} Speedup")
+
+    workers = 1
+    while workers <= max_workers:
+        start = time.perf_counter()
+        result = parallelCountInversions(A, B, N, workers)
+        elapsed = time.perf_counter() - start
+        if result != expected:
+            raise AssertionError(f"{workers} workers counted {result}, expected {expected}")
+        print(f"{workers:<10} {elapsed:<12.3f} {serial_time / elapsed:.2f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,245 @@
+import asyncio
+import random
+import time
+
+from task4_server_load_balancing import LoadBalancer, whole_task_load
+
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class TaskIngestor:
+    """
+    asyncio front end that feeds a stream of task submissions into a
+    LoadBalancer.
+
+    Producers await submit(task_id, task_load) and get back the name of the
+    server the task was placed on. A single consumer drains the submission
+    queue in micro-batches of up to batch_size tasks, waiting at most
+    max_delay seconds for a batch to fill. Each batch is sorted once,
+    largest first, and assigned in one pass, as distribute_tasks does.
+
+    Backpressure comes from two places. The queue holds at most max_pending
+    submissions, so producers wait once it is full. And while the fleet's
+    total free capacity is below min_free_capacity, the consumer stops taking
+    batches until capacity_changed() is called, typically after servers are
+    added. complete(task_id) finishes a task through the balancer and calls
+    it too. Meanwhile the queue fills up and producers stall instead of
+    failing.
+
+    stop() never waits on the full queue. It tells the consumer to assign
+    everything queued, ignoring min_free_capacity, so tasks that no longer
+    fit are rejected rather than left waiting.
+
+    The time from submit to assignment is recorded for every task;
+    latency_report() summarizes it.
+    """
+
+    def __init__(self, balancer: LoadBalancer, batch_size: int = 1024, max_delay: float = 0.002,
+                 max_pending: int = 10000, min_free_capacity: int = 0):
+        if batch_size <= 0 or max_pending <= 0:
+            raise ValueError("Batch size and queue length must be positive.")
+        self.balancer = balancer
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.min_free_capacity = min_free_capacity
+
+        self._queue = asyncio.Queue(maxsize=max_pending)
+        self._capacity_changed = asyncio.Event()
+        self._consumer = None
+        self._stopping = False
+        self._stopped = False
+
+        self.latencies = []
+        self.assigned = 0
+        self.rejected = 0
+        self.batches = 0
+
+    async def __aenter__(self):
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def start(self):
+        """Start the consumer task on the running event loop."""
+        if self._consumer is None:
+            self._stopping = self._stopped = False
+            self._consumer = asyncio.create_task(self._consume())
+
+    async def stop(self):
+        """Assign everything already submitted, then stop the consumer."""
+        if self._consumer is not None:
+            self._stopping = True
+            # Release a consumer waiting for capacity, and wake one waiting
+            # on an empty queue. A full queue needs no marker: the consumer
+            # checks _stopping before it waits on the queue again.
+            self._capacity_changed.set()
+            try:
+                self._queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
+            await self._consumer
+            self._consumer = None
+            self._stopped = True
+            self._reject_queued()
+
+    async def submit(self, task_id, task_load: int) -> str:
+        """
+        Submit one task and wait until it is assigned.
+
+        Returns:
+            Name of the server the task was placed on
+
+        Raises:
+            ValueError: If the load is not a positive whole number, the task
+            ID is already assigned, no server can take the task, or the
+            ingestor stopped
+        """
+        task_load = whole_task_load(task_load)
+        if task_load <= 0:
+            raise ValueError(f"Task load must be positive: {task_id}")
+        if self._stopping:
+            raise ValueError(f"Task {task_id} rejected: ingestor stopped")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((task_id, task_load, future, time.perf_counter()))
+        if self._stopped:
+            # The consumer exited while this producer waited for room
+            self._reject_queued()
+        return await future
+
+    def complete(self, task_id) -> int:
+        """
+        Finish a task placed through this ingestor, freeing its load, and
+        wake the consumer. Returns the task's load.
+        """
+        task_load = self.balancer.complete_task(task_id)
+        self.capacity_changed()
+        return task_load
+
+    def capacity_changed(self):
+        """Wake the consumer after servers were added or tasks completed."""
+        self._capacity_changed.set()
+
+    def latency_report(self) -> dict:
+        """Assignment latency percentiles in milliseconds, with task counts."""
+        ordered = sorted(self.latencies)
+        return {
+            'assigned': self.assigned,
+            'rejected': self.rejected,
+            'batches': self.batches,
+            'p50_ms': percentile(ordered, 0.50) * 1000,
+            'p99_ms': percentile(ordered, 0.99) * 1000,
+            'max_ms': (ordered[-1] if ordered else 0.0) * 1000,
+        }
+
+    def _free_capacity(self) -> int:
+        return sum(server.capacity - server.current_load for server in self.balancer.servers.values())
+
+    async def _wait_for_capacity(self):
+        while (not self._stopping and self.min_free_capacity
+               and self._free_capacity() < self.min_free_capacity):
+            self._capacity_changed.clear()
+            await self._capacity_changed.wait()
+
+    async def _next_batch(self) -> list:
+        # Block for the first submission, then take whatever else is queued,
+        # giving a partial batch up to max_delay to fill. The wake-up marker
+        # put by stop() is skipped.
+        first = await self._queue.get()
+        batch = [] if first is None else [first]
+        self._drain(batch)
+        if (batch and not self._stopping and len(batch) < self.batch_size
+                and self.max_delay > 0):
+            await asyncio.sleep(self.max_delay)
+            self._drain(batch)
+        return batch
+
+    def _drain(self, batch):
+        # Move queued submissions into the batch until it is full
+        while len(batch) < self.batch_size:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if item is not None:
+                batch.append(item)
+
+    def _reject_queued(self):
+        # Fail submissions that arrived after the consumer exited
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            if item is not None and not item[2].done():
+                self.rejected += 1
+                item[2].set_exception(ValueError(f"Task {item[0]} rejected: ingestor stopped"))
+
+    async def _consume(self):
+        # Runs until stop() was called and the queue is empty
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._next_batch()
+            if batch:
+                await self._wait_for_capacity()
+                self._assign(batch)
+                # Let producers refill the queue between batches
+                await asyncio.sleep(0)
+
+    def _assign(self, batch):
+        # One largest-first sort per batch, then one assignment pass
+        batch.sort(key=lambda item: item[1], reverse=True)
+        self.batches += 1
+        for task_id, task_load, future, submitted in batch:
+            try:
+                server = self.balancer.assign_task(task_load, task_id)
+            except ValueError as e:
+                self.rejected += 1
+                if not future.done():
+                    future.set_exception(ValueError(f"Task {task_id} rejected: {e}"))
+                continue
+            self.assigned += 1
+            self.latencies.append(time.perf_counter() - submitted)
+            if not future.done():
+                future.set_result(server.name)
+
+
+async def simulate(num_servers: int = 1000, num_tasks: int = 100000, producers: int = 50,
+                   seed: int = 0) -> dict:
+    """
+    Drive a TaskIngestor with concurrent in-process producers and return its
+    latency report.
+    """
+    rng = random.Random(seed)
+    balancer = LoadBalancer()
+    for i in range(num_servers):
+        balancer.add_server(f"S{i}", rng.randint(5000, 20000))
+
+    async def produce(worker, count):
+        for i in range(count):
+            try:
+                await ingestor.submit(f"p{worker}_t{i}", rng.randint(1, 100))
+            except ValueError:
+                pass
+
+    async with TaskIngestor(balancer) as ingestor:
+        share = num_tasks // producers
+        await asyncio.gather(*(produce(worker, share) for worker in range(producers)))
+
+    return ingestor.latency_report()
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    report = asyncio.run(simulate())
+    elapsed = time.perf_counter() - start
+    print(f"Assigned {report['assigned']} tasks in {report['batches']} batches "
+          f"({report['rejected']} rejected) in {elapsed:.2f} s")
+    print(f"Latency p50 {report['p50_ms']:.2f} ms, p99 {report['p99_ms']:.2f} ms, "
+          f"max {report['max_ms']:.2f} ms")
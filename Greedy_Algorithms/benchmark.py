@@ -0,0 +1,63 @@
+import random
+import sys
+import threading
+import time
+
+from sharded_balancer import ShardedLoadBalancer
+from task4_server_load_balancing import LoadBalancer
+
+
+class LockedLoadBalancer:
+    """Baseline: one LoadBalancer behind a single global lock."""
+
+    def __init__(self):
+        self.balancer = LoadBalancer()
+        self.lock = threading.Lock()
+
+    def add_server(self, name, capacity):
+        self.balancer.add_server(name, capacity)
+
+    def assign_task(self, task_load):
+        with self.lock:
+            return self.balancer.assign_task(task_load).name
+
+
+def run_threads(balancer, num_threads, tasks_per_thread, seed=0):
+    """Assign tasks from num_threads threads at once; returns tasks per second."""
+    loads = [[random.Random(seed + t).randint(1, 100) for _ in range(tasks_per_thread)]
+             for t in range(num_threads)]
+    barrier = threading.Barrier(num_threads + 1)
+
+    def worker(thread_loads):
+        barrier.wait()
+        for task_load in thread_loads:
+            balancer.assign_task(task_load)
+
+    threads = [threading.Thread(target=worker, args=(thread_loads,)) for thread_loads in loads]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return num_threads * tasks_per_thread / (time.perf_counter() - start)
+
+
+def benchmark_threads(num_servers=4096, tasks_per_thread=50000, thread_counts=(1, 2, 4, 8),
+                      num_shards=16):
+    """Throughput of the sharded balancer against a single global lock."""
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Threaded assignment, {num_servers} servers, GIL {'enabled' if gil else 'disabled'}")
+    print(f"{'Threads':<10} {'global lock (tasks/s)':<24} {'sharded (tasks/s)':<20}")
+    print("-" * 54)
+    for num_threads in thread_counts:
+        results = []
+        for balancer in (LockedLoadBalancer(), ShardedLoadBalancer(num_shards, seed=0)):
+            for i in range(num_servers):
+                balancer.add_server(f"S{i}", 10 ** 9)
+            results.append(run_threads(balancer, num_threads, tasks_per_thread))
+        print(f"{num_threads:<10} {results[0]:<24,.0f} {results[1]:<20,.0f}")
+
+
+if __name__ == "__main__":
+    benchmark_threads()
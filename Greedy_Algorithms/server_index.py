@@ -0,0 +1,139 @@
+import random
+
+
+class _Node:
+    __slots__ = ('key', 'server', 'free', 'max_free', 'priority', 'left', 'right')
+
+    def __init__(self, key, server, free, priority):
+        self.key = key
+        self.server = server
+        self.free = free
+        self.max_free = free
+        self.priority = priority
+        self.left = None
+        self.right = None
+
+    def refresh(self):
+        # Recompute the largest remaining capacity in this subtree
+        max_free = self.free
+        if self.left is not None and self.left.max_free > max_free:
+            max_free = self.left.max_free
+        if self.right is not None and self.right.max_free > max_free:
+            max_free = self.right.max_free
+        self.max_free = max_free
+
+
+def _split(node, key):
+    # Split into the nodes with keys < key and the nodes with keys >= key
+    if node is None:
+        return None, None
+    if node.key < key:
+        left, right = _split(node.right, key)
+        node.right = left
+        node.refresh()
+        return node, right
+    left, right = _split(node.left, key)
+    node.left = right
+    node.refresh()
+    return left, node
+
+
+def _merge(left, right):
+    # Join two treaps where every key in left is below every key in right
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        left.refresh()
+        return left
+    right.left = _merge(left, right.left)
+    right.refresh()
+    return right
+
+
+def by_utilization(server):
+    """Index order for least-utilization placement (the default)."""
+    return server.get_utilization()
+
+
+def by_remaining_capacity(server):
+    """Index order for best-fit placement: tightest remaining capacity first."""
+    return server.capacity - server.current_load
+
+
+class ServerIndex:
+    """
+    Ordered index over servers that answers "least-utilized server that can
+    take this load" (or the first such server in another order) in O(log S).
+
+    Servers are kept in a treap ordered by (utilization, arrival), where
+    arrival is the order the servers were registered in. Another order can be
+    passed as a function of the server; by_remaining_capacity turns the query
+    into best fit. Every subtree also
+    records the largest remaining capacity inside it. A query walks down from
+    the root, going left whenever the left subtree still has a server with
+    enough room, so it finds the first fitting server in that order. This is
+    the same server min() picks from a scan in registration order, ties
+    included. After a server's load changes, update() re-keys it in
+    O(log S).
+    """
+
+    def __init__(self, order=None, seed=None):
+        self._order = order if order is not None else by_utilization
+        self._root = None
+        self._keys = {}
+        self._arrivals = 0
+        self._random = random.Random(seed)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, server):
+        return server.name in self._keys
+
+    def insert(self, server):
+        """Register a server after all servers registered so far."""
+        if server.name in self._keys:
+            raise ValueError(f"Server {server.name} is already indexed.")
+        self._arrivals += 1
+        self._attach(server, self._arrivals)
+
+    def remove(self, server):
+        """Drop a server from the index."""
+        key = self._keys.pop(server.name)
+        left, rest = _split(self._root, key)
+        _, right = _split(rest, (key[0], key[1] + 1))
+        self._root = _merge(left, right)
+
+    def update(self, server):
+        """Re-key a server after its load changed, keeping its arrival order."""
+        arrival = self._keys[server.name][1]
+        self.remove(server)
+        self._attach(server, arrival)
+
+    def first_fitting(self, task_load):
+        """
+        First server in index order with at least task_load free capacity, or
+        None: by default the least-utilized one. Ties go to the server
+        registered first.
+        """
+        node = self._root
+        while node is not None:
+            if node.left is not None and node.left.max_free >= task_load:
+                node = node.left
+            elif node.free >= task_load:
+                return node.server
+            elif node.right is not None and node.right.max_free >= task_load:
+                node = node.right
+            else:
+                return None
+        return None
+
+    def _attach(self, server, arrival):
+        key = (self._order(server), arrival)
+        self._keys[server.name] = key
+        node = _Node(key, server, server.capacity - server.current_load, self._random.random())
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, node), right)
@@ -0,0 +1,266 @@
+import random
+import threading
+from contextlib import ExitStack
+
+from task4_server_load_balancing import LoadBalancer, whole_task_load
+
+
+class Shard:
+    """A group of servers behind one lock, with its own LoadBalancer and index."""
+    __slots__ = ('lock', 'balancer', 'capacity', 'load')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.balancer = LoadBalancer()
+        self.capacity = 0
+        self.load = 0
+
+    def utilization(self) -> float:
+        return self.load / self.capacity if self.capacity else float('inf')
+
+
+class ShardedLoadBalancer:
+    """
+    Thread-safe load balancer for concurrent task assignment.
+
+    Servers are spread round-robin over num_shards shards. Each shard has its
+    own lock and its own LoadBalancer, whose index finds the least-utilized
+    fitting server in O(log S). A task samples two shards at random, tries the
+    less utilized one first (power-of-two-choices), and holds only that
+    shard's lock while it is placed. Threads working on different shards
+    therefore never wait for each other.
+
+    Server failures, rebalancing and distribution snapshots take every shard
+    lock, in shard order, so they see and leave a consistent fleet.
+
+    Tasks assigned with an ID can later be completed by that ID. The task ID
+    -> shard map has its own lock, which is always taken last.
+    """
+
+    def __init__(self, num_shards: int = 8, seed: int = None):
+        if num_shards <= 0:
+            raise ValueError("Number of shards must be positive.")
+        self._shards = [Shard() for _ in range(num_shards)]
+        # Server name -> shard; guarded by the registry lock, which is always
+        # taken before any shard lock
+        self._locations = {}
+        self._registry_lock = threading.Lock()
+        # Task ID -> shard, or None while the task is being placed
+        self._task_shards = {}
+        self._task_lock = threading.Lock()
+        self._seed = seed
+        self._local = threading.local()
+
+    def add_server(self, name: str, capacity: int):
+        """
+        Add a new server to the next shard in round-robin order.
+        """
+        with self._registry_lock:
+            if name in self._locations:
+                raise ValueError(f"Server {name} already exists.")
+            shard = self._shards[len(self._locations) % len(self._shards)]
+            with shard.lock:
+                shard.balancer.add_server(name, capacity)
+                shard.capacity += capacity
+            self._locations[name] = shard
+
+    def assign_task(self, task_load: int, task_id=None) -> str:
+        """
+        Place one task and return the name of the chosen server.
+        The load must be a whole number (see whole_task_load), and a task
+        ID, if given, must not already be assigned.
+        Safe to call from many threads at once.
+        """
+        task_load = whole_task_load(task_load)
+        if task_load <= 0:
+            raise ValueError(f"Task load must be positive: {task_load}")
+        if task_id is not None:
+            with self._task_lock:
+                if task_id in self._task_shards:
+                    raise ValueError(f"Task {task_id} is already assigned.")
+                self._task_shards[task_id] = None
+
+        # Power-of-two-choices: the less utilized of two random shards first
+        rng = self._random()
+        first, second = rng.sample(self._shards, 2) if len(self._shards) > 1 else self._shards * 2
+        if second.utilization() < first.utilization():
+            first, second = second, first
+
+        for shard in (first, second):
+            name = self._try_assign(shard, task_load, task_id)
+            if name is not None:
+                return name
+
+        # Both samples are full; only give up if no shard can take the task
+        for shard in self._shards:
+            name = self._try_assign(shard, task_load, task_id)
+            if name is not None:
+                return name
+        if task_id is not None:
+            with self._task_lock:
+                del self._task_shards[task_id]
+        raise ValueError(f"No server can accommodate task of size {task_load}")
+
+    def complete_task(self, task_id) -> int:
+        """
+        Remove a finished task by its ID, holding only its shard's lock.
+        Returns the task's load.
+        """
+        while True:
+            with self._task_lock:
+                shard = self._task_shards.get(task_id)
+            if shard is None:
+                raise ValueError(f"Task {task_id} not found.")
+            with shard.lock:
+                with self._task_lock:
+                    if self._task_shards.get(task_id) is not shard:
+                        # A server failure moved the task meanwhile; look again
+                        continue
+                    del self._task_shards[task_id]
+                task_load = shard.balancer.complete_task(task_id)
+                shard.load -= task_load
+                return task_load
+
+    def distribute_tasks(self, tasks: dict) -> dict:
+        """
+        Distribute tasks largest first.
+
+        Args:
+            tasks: Dictionary mapping task identifiers to their load values,
+                whole numbers (see whole_task_load)
+        Returns:
+            Dictionary mapping each task identifier to its server name
+        """
+        loads = []
+        for task_id, task_load in tasks.items():
+            task_load = whole_task_load(task_load)
+            if task_load <= 0:
+                raise ValueError(f"Task load must be positive: {task_id}")
+            loads.append((task_id, task_load))
+
+        assignments = {}
+        for task_id, task_load in sorted(loads, key=lambda x: x[1], reverse=True):
+            try:
+                assignments[task_id] = self.assign_task(task_load, task_id)
+            except ValueError as e:
+                raise ValueError(f"Task distribution failed: {str(e)}")
+        return assignments
+
+    def handle_server_failure(self, failed_server: str) -> dict:
+        """
+        Remove a failed server and move its tasks, largest first, to the
+        least-utilized fitting servers across all shards.
+
+        The whole fleet is locked for the move. If some task cannot be
+        placed, every move is undone and the server is restored.
+
+        Returns:
+            Dictionary mapping each moved task's ID to its new server name;
+            tasks added without an ID are keyed failed_task_i by their
+            position in the largest-first order
+        """
+        with self._registry_lock, self._locked_fleet():
+            shard = self._locations.get(failed_server)
+            if shard is None:
+                raise ValueError(f"Server {failed_server} not found.")
+            server = shard.balancer.remove_server(failed_server)
+            shard.capacity -= server.capacity
+            shard.load -= server.current_load
+
+            moves = {}
+            placed = []
+            orphaned_tasks = sorted(zip(server.tasks, server.task_ids), key=lambda x: x[0], reverse=True)
+            try:
+                for i, (task_load, task_id) in enumerate(orphaned_tasks):
+                    target_shard = self._least_utilized_shard(task_load)
+                    target = target_shard.balancer.assign_task(task_load, task_id)
+                    target_shard.load += task_load
+                    placed.append((target_shard, target))
+                    moves[f"failed_task_{i}" if task_id is None else task_id] = target.name
+            except ValueError as e:
+                # Undo the moves newest first, then bring the server back
+                for target_shard, target in reversed(placed):
+                    target_shard.load -= target_shard.balancer.undo_assignment(target)
+                shard.balancer.restore_server(server)
+                shard.capacity += server.capacity
+                shard.load += server.current_load
+                raise ValueError(f"Failed to redistribute tasks: {str(e)}")
+
+            with self._task_lock:
+                for (task_load, task_id), (target_shard, _) in zip(orphaned_tasks, placed):
+                    if task_id is not None:
+                        self._task_shards[task_id] = target_shard
+            del self._locations[failed_server]
+            return moves
+
+    def rebalance(self, max_migration_load: int) -> list:
+        """
+        Migrate tasks to lower the highest utilization, moving at most
+        max_migration_load in total.
+
+        Shards are rebalanced in turn, each with what is left of the budget.
+        Tasks move between servers of the same shard; power-of-two-choices
+        already keeps the shards themselves close to each other.
+
+        Returns:
+            List of migrations, each a dict with task_id, load, source and target
+        """
+        migrations = []
+        with self._locked_fleet():
+            for shard in self._shards:
+                budget = max_migration_load - sum(move['load'] for move in migrations)
+                if budget <= 0:
+                    break
+                migrations.extend(shard.balancer.rebalance(budget))
+        return migrations
+
+    def get_current_distribution(self) -> dict:
+        """
+        Consistent snapshot of every server's state, keyed by server name.
+        """
+        with self._locked_fleet():
+            servers = {}
+            for shard in self._shards:
+                servers.update(shard.balancer.get_current_distribution().snapshot())
+        return dict(sorted(servers.items()))
+
+    def _random(self) -> random.Random:
+        # One generator per thread, so sampling needs no lock
+        rng = getattr(self._local, 'rng', None)
+        if rng is None:
+            seed = None if self._seed is None else self._seed + threading.get_ident()
+            rng = self._local.rng = random.Random(seed)
+        return rng
+
+    def _try_assign(self, shard: Shard, task_load: int, task_id=None):
+        with shard.lock:
+            try:
+                server = shard.balancer.assign_task(task_load, task_id)
+            except ValueError:
+                return None
+            shard.load += task_load
+            if task_id is not None:
+                with self._task_lock:
+                    self._task_shards[task_id] = shard
+            return server.name
+
+    def _locked_fleet(self) -> ExitStack:
+        # Take every shard lock in a fixed order to avoid deadlocks
+        stack = ExitStack()
+        for shard in self._shards:
+            stack.enter_context(shard.lock)
+        return stack
+
+    def _least_utilized_shard(self, task_load: int) -> Shard:
+        # Caller holds every shard lock; compare each shard's best fitting server
+        best_shard, best_utilization = None, None
+        for shard in self._shards:
+            try:
+                utilization = shard.balancer.find_best_server_for_task(task_load).get_utilization()
+            except ValueError:
+                continue
+            if best_utilization is None or utilization < best_utilization:
+                best_shard, best_utilization = shard, utilization
+        if best_shard is None:
+            raise ValueError(f"No server can accommodate task of size {task_load}")
+        return best_shard
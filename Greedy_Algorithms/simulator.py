@@ -0,0 +1,235 @@
+import argparse
+import csv
+import heapq
+import random
+import time
+
+from async_ingestion import percentile
+from server_index import ServerIndex, by_remaining_capacity
+from task4_server_load_balancing import LoadBalancer
+
+
+class BestFitLoadBalancer(LoadBalancer):
+    """Places each task on the fitting server with the least room left."""
+
+    def __init__(self):
+        super().__init__(ServerIndex(by_remaining_capacity))
+
+
+class TwoChoiceLoadBalancer(LoadBalancer):
+    """
+    Power-of-two-choices: samples two servers at random and takes the less
+    utilized one that fits, falling back to the least-utilized fitting server
+    when neither does.
+    """
+
+    def __init__(self, seed: int = 0):
+        super().__init__()
+        self._random = random.Random(seed)
+        self._pool = None
+
+    def add_server(self, name: str, capacity: int):
+        super().add_server(name, capacity)
+        self._pool = None
+
+    def remove_server(self, name: str):
+        self._pool = None
+        return super().remove_server(name)
+
+    def restore_server(self, server):
+        super().restore_server(server)
+        self._pool = None
+
+    def find_best_server_for_task(self, task_load: int):
+        if self._pool is None:
+            self._pool = list(self.servers.values())
+        if len(self._pool) >= 2:
+            fitting = [server for server in self._random.sample(self._pool, 2)
+                       if server.can_add_task(task_load)]
+            if fitting:
+                return min(fitting, key=lambda s: s.get_utilization())
+        return super().find_best_server_for_task(task_load)
+
+
+POLICIES = {
+    'least-utilization': LoadBalancer,
+    'best-fit': BestFitLoadBalancer,
+    'two-choices': TwoChoiceLoadBalancer,
+}
+
+
+def make_fleet(num_servers: int = 1000, min_capacity: int = 500, max_capacity: int = 2000,
+               seed: int = 0) -> dict:
+    """Server name -> capacity for a fleet of mixed server sizes."""
+    rng = random.Random(seed)
+    return {f"S{i}": rng.randint(min_capacity, max_capacity) for i in range(num_servers)}
+
+
+def synthetic_trace(fleet: dict, num_events: int = 10 ** 6, arrival_rate: float = 1000.0,
+                    mean_duration: float = 30.0, min_load: int = 10, load_alpha: float = 1.5,
+                    failure_rate: float = 0.05, recovery_time: float = 60.0, seed: int = 0):
+    """
+    Generate (time, kind, ident, value) events in time order.
+
+    - Arrivals are Poisson at arrival_rate per second. Each task's load is
+      Pareto-distributed (heavy-tailed) from min_load upwards, capped at the
+      smallest server's capacity.
+    - Each task departs after an exponential duration with mean
+      mean_duration.
+    - Server failures are Poisson at failure_rate per second. The failed
+      server comes back recovery_time seconds later.
+
+    Kinds are 'arrive' (task id, load), 'depart' (task id), 'fail' (server)
+    and 'recover' (server, capacity).
+    """
+    rng = random.Random(seed)
+    names = list(fleet)
+    max_load = min(fleet.values())
+    pending = []
+    sequence = 0
+    produced = 0
+    now = 0.0
+    next_failure = rng.expovariate(failure_rate) if failure_rate > 0 else float('inf')
+    task_id = 0
+
+    def schedule(at, kind, ident, value):
+        nonlocal sequence
+        sequence += 1
+        heapq.heappush(pending, (at, sequence, kind, ident, value))
+
+    while produced < num_events:
+        now += rng.expovariate(arrival_rate)
+        while next_failure <= now:
+            server = rng.choice(names)
+            schedule(next_failure, 'fail', server, 0)
+            schedule(next_failure + recovery_time, 'recover', server, fleet[server])
+            next_failure += rng.expovariate(failure_rate)
+
+        # Departures and failures that happen before this arrival
+        while pending and pending[0][0] <= now and produced < num_events:
+            at, _, kind, ident, value = heapq.heappop(pending)
+            yield at, kind, ident, value
+            produced += 1
+        if produced >= num_events:
+            break
+
+        load = min(max_load, int(min_load * rng.paretovariate(load_alpha)))
+        yield now, 'arrive', task_id, load
+        produced += 1
+        schedule(now + rng.expovariate(1 / mean_duration), 'depart', task_id, 0)
+        task_id += 1
+
+
+def write_trace(path: str, events):
+    """Save events as CSV rows: time, kind, ident, value."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        for event in events:
+            writer.writerow(event)
+
+
+def read_trace(path: str):
+    """Replay a CSV trace written by write_trace or recorded in the same format."""
+    with open(path, newline='') as f:
+        for at, kind, ident, value in csv.reader(f):
+            if kind in ('arrive', 'depart'):
+                ident = int(ident) if ident.isdigit() else ident
+            yield float(at), kind, ident, int(value)
+
+
+def simulate(events, fleet: dict, policy: str = 'least-utilization', sample_every: int = 1000) -> dict:
+    """
+    Drive a load balancer with an event stream and report how it did.
+
+    Arrivals go through distribute_tasks, departures through complete_task,
+    failures through handle_server_failure, and recoveries add the server
+    back. Every sample_every events the spread between the most and least
+    utilized servers is sampled.
+
+    Returns:
+        dict with assignment latency percentiles (microseconds), utilization
+        spread (percentage points), rejection rate and failure counts
+    """
+    balancer = POLICIES[policy]()
+    for name, capacity in fleet.items():
+        balancer.add_server(name, capacity)
+
+    latencies = []
+    spreads = []
+    count = arrivals = rejected = failures = failed_failovers = 0
+    clock = time.perf_counter
+    start = clock()
+
+    for count, (_, kind, ident, value) in enumerate(events, 1):
+        if kind == 'arrive':
+            arrivals += 1
+            before = clock()
+            try:
+                balancer.distribute_tasks({ident: value})
+            except ValueError:
+                rejected += 1
+            latencies.append(clock() - before)
+        elif kind == 'depart':
+            try:
+                balancer.complete_task(ident)
+            except ValueError:
+                pass  # The task was rejected on arrival
+        elif kind == 'fail':
+            if ident in balancer.servers:
+                failures += 1
+                try:
+                    balancer.handle_server_failure(ident)
+                except ValueError:
+                    failed_failovers += 1
+        elif kind == 'recover':
+            if ident not in balancer.servers:
+                balancer.add_server(ident, value)
+
+        if count % sample_every == 0:
+            utilizations = [server.get_utilization() for server in balancer.servers.values()]
+            spreads.append(max(utilizations) - min(utilizations))
+
+    elapsed = clock() - start
+    latencies.sort()
+    return {
+        'policy': policy,
+        'events': count,
+        'seconds': elapsed,
+        'arrivals': arrivals,
+        'rejection_rate': rejected / arrivals if arrivals else 0.0,
+        'p50_us': percentile(latencies, 0.50) * 1e6,
+        'p99_us': percentile(latencies, 0.99) * 1e6,
+        'spread_mean': sum(spreads) / len(spreads) if spreads else 0.0,
+        'spread_max': max(spreads, default=0.0),
+        'failures': failures,
+        'failed_failovers': failed_failovers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare load balancing policies on a workload.")
+    parser.add_argument('--events', type=int, default=10 ** 6, help="synthetic events per run")
+    parser.add_argument('--servers', type=int, default=1000, help="servers in the fleet")
+    parser.add_argument('--trace', help="replay this CSV trace instead of a synthetic one")
+    parser.add_argument('--write-trace', help="save the synthetic trace to this CSV file")
+    parser.add_argument('--policies', nargs='+', default=list(POLICIES), choices=list(POLICIES))
+    args = parser.parse_args()
+
+    fleet = make_fleet(args.servers)
+    if args.write_trace:
+        write_trace(args.write_trace, synthetic_trace(fleet, args.events))
+
+    print(f"{'Policy':<20} {'p50 (us)':<10} {'p99 (us)':<10} {'spread avg/max (pp)':<21} "
+          f"{'rejected':<10} {'failovers failed':<17} Time (s)")
+    print("-" * 100)
+    for policy in args.policies:
+        events = read_trace(args.trace) if args.trace else synthetic_trace(fleet, args.events)
+        report = simulate(events, fleet, policy)
+        spread = f"{report['spread_mean']:.1f}/{report['spread_max']:.1f}"
+        failovers = f"{report['failed_failovers']}/{report['failures']}"
+        print(f"{policy:<20} {report['p50_us']:<10.1f} {report['p99_us']:<10.1f} {spread:<21} "
+              f"{report['rejection_rate']:<10.2%} {failovers:<17} {report['seconds']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
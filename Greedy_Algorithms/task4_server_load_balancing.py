@@ -9,17 +9,50 @@
 #    b. Redistribute its tasks to the remaining servers.
 # 5. Print the task distribution before and after failure.
 
+import heapq
+import numbers
+from array import array
+from collections.abc import Mapping
+
+from server_index import ServerIndex
+
+
+def whole_task_load(task_load) -> int:
+    """
+    Task load as an int. Servers store loads in a signed 64-bit array, so a
+    load must be a whole number in its range; a float such as 5.0 is taken
+    as 5, while 2.5, strings and None raise ValueError.
+    """
+    if isinstance(task_load, numbers.Integral):
+        value = int(task_load)
+    elif isinstance(task_load, numbers.Real) and float(task_load).is_integer():
+        value = int(task_load)
+    else:
+        raise ValueError(f"Task load must be a whole number, not {task_load!r}")
+    if not -2 ** 63 <= value < 2 ** 63:
+        raise ValueError(f"Task load {value} does not fit in 64 bits")
+    return value
+
+
 class Server:
+    # Fixed attributes and a typed task array keep large fleets compact
+    __slots__ = ('name', 'capacity', 'tasks', 'task_ids', 'current_load', '_positions')
+
     def __init__(self, name: str, capacity: int):
         """
         Initializing a server with its capacity and task list.
         
-        The server keeps track of its current load and maintains a list of assigned tasks.
+        The server keeps track of its current load and stores the assigned task
+        loads in a signed 64-bit array rather than a list of boxed ints.
+        task_ids runs parallel to tasks (None for tasks added without an ID),
+        and each ID's position is indexed so a task can be removed in O(1).
         """
         self.name = name
         self.capacity = capacity
-        self.tasks = []
+        self.tasks = array('q')
+        self.task_ids = []
         self.current_load = 0
+        self._positions = {}
 
     def can_add_task(self, task_load: int) -> bool:
         """
@@ -28,17 +61,56 @@ class Server:
         """
         return self.current_load + task_load <= self.capacity
 
-    def add_task(self, task_load: int) -> bool:
+    def add_task(self, task_load: int, task_id=None) -> bool:
         """
         Adding a task to the server if capacity allows.
         Returns True if task was added successfully, False otherwise.
         """
         if self.can_add_task(task_load):
+            # Append first, so a load the array rejects leaves no trace
             self.tasks.append(task_load)
+            if task_id is not None:
+                self._positions[task_id] = len(self.tasks) - 1
+            self.task_ids.append(task_id)
             self.current_load += task_load
             return True
         return False
 
+    def remove_task(self, task_id) -> int:
+        """
+        Removing a task by its ID in O(1).
+        Returns its load.
+        """
+        if task_id not in self._positions:
+            raise ValueError(f"Task {task_id} not found on server {self.name}.")
+        return self.remove_task_at(self._positions[task_id])
+
+    def remove_task_at(self, position: int) -> int:
+        """
+        Removing the task at a position in O(1); the last task takes its place.
+        Returns its load.
+        """
+        tasks, task_ids = self.tasks, self.task_ids
+        task_load, task_id = tasks[position], task_ids[position]
+        last = len(tasks) - 1
+        if position != last:
+            tasks[position], task_ids[position] = tasks[last], task_ids[last]
+            if task_ids[position] is not None:
+                self._positions[task_ids[position]] = position
+        tasks.pop()
+        task_ids.pop()
+        if task_id is not None:
+            del self._positions[task_id]
+        self.current_load -= task_load
+        return task_load
+
+    def pop_task(self) -> int:
+        """
+        Removing the most recently added task.
+        Returns its load, so an assignment can be undone.
+        """
+        return self.remove_task_at(len(self.tasks) - 1)
+
     def get_utilization(self) -> float:
         """
         Calculating server utilization as a percentage.
@@ -47,10 +119,87 @@ class Server:
         return (self.current_load / self.capacity) * 100 if self.capacity > 0 else 0
 
 
+class ServerView(Mapping):
+    """
+    Read-only view of one server's state in a distribution.
+
+    Values are read from the server when accessed, so the view always shows
+    the server's current state. 'tasks' is returned as a new list.
+    """
+    __slots__ = ('_server',)
+
+    _fields = ('capacity', 'current_load', 'utilization', 'tasks')
+
+    def __init__(self, server: Server):
+        self._server = server
+
+    def __getitem__(self, field):
+        server = self._server
+        if field == 'capacity':
+            return server.capacity
+        if field == 'current_load':
+            return server.current_load
+        if field == 'utilization':
+            return server.get_utilization()
+        if field == 'tasks':
+            return server.tasks.tolist()
+        raise KeyError(field)
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class DistributionView(Mapping):
+    """
+    Read-only view of the task distribution across servers, keyed by server
+    name in sorted order.
+
+    Nothing is copied when the view is created. Per-server entries are built
+    on access and show the balancer's current state. Call
+    snapshot() to keep a frozen copy.
+    """
+    __slots__ = ('_servers',)
+
+    def __init__(self, servers: dict):
+        self._servers = servers
+
+    def __getitem__(self, name):
+        return ServerView(self._servers[name])
+
+    def __iter__(self):
+        return iter(sorted(self._servers))
+
+    def __len__(self):
+        return len(self._servers)
+
+    def __repr__(self):
+        return repr(self.snapshot())
+
+    def snapshot(self) -> dict:
+        """Copy the current distribution into plain nested dicts."""
+        return {name: dict(info) for name, info in self.items()}
+
+
 class LoadBalancer:
-    def __init__(self):
-        """Initialize the load balancer with an empty server dictionary."""
+    def __init__(self, index: ServerIndex = None):
+        """
+        Initialize the load balancer with an empty server dictionary.
+        An empty ServerIndex with another order can be passed to change the
+        placement policy; the default places tasks by lowest utilization.
+        """
         self.servers = {}
+        # Servers ordered by utilization, for O(log S) server selection
+        self._index = index if index is not None else ServerIndex()
+        # Task ID -> server holding it, for O(1) completion
+        self._task_locations = {}
+        # Servers whose load dropped since they were last re-keyed in the index
+        self._stale = set()
 
     def add_server(self, name: str, capacity: int):
         """
@@ -61,30 +210,97 @@ class LoadBalancer:
         if name in self.servers:
             raise ValueError(f"Server {name} already exists.")
         self.servers[name] = Server(name, capacity)
+        self._index.insert(self.servers[name])
+
+    def remove_server(self, name: str) -> Server:
+        """
+        Removing a server without redistributing its tasks.
+        Returns the removed Server, which still holds its tasks.
+        """
+        if name not in self.servers:
+            raise ValueError(f"Server {name} not found.")
+        server = self.servers.pop(name)
+        self._index.remove(server)
+        self._stale.discard(server)
+        for task_id in server.task_ids:
+            self._task_locations.pop(task_id, None)
+        return server
+
+    def restore_server(self, server: Server):
+        """
+        Re-adding a previously removed Server together with its tasks.
+        """
+        if server.name in self.servers:
+            raise ValueError(f"Server {server.name} already exists.")
+        self.servers[server.name] = server
+        self._index.insert(server)
+        for task_id in server.task_ids:
+            if task_id is not None:
+                self._task_locations[task_id] = server
+
+    def undo_assignment(self, server: Server) -> int:
+        """
+        Taking back the task most recently assigned to a server.
+        Returns its load.
+        """
+        task_id = server.task_ids[-1]
+        task_load = server.pop_task()
+        self._task_locations.pop(task_id, None)
+        self._index.update(server)
+        return task_load
+
+    def complete_task(self, task_id) -> int:
+        """
+        Removing a finished task by its ID in O(1).
+        The server is re-keyed in the index lazily, before the next placement.
+        Returns the task's load.
+        """
+        if task_id not in self._task_locations:
+            raise ValueError(f"Task {task_id} not found.")
+        server = self._task_locations.pop(task_id)
+        self._stale.add(server)
+        return server.remove_task(task_id)
 
     def find_best_server_for_task(self, task_load: int) -> Server:
         """
         Finding the most suitable server for a task based on current utilization.
+        The server index answers this in O(log S); ties go to the server added first.
         """
-        # Filtering servers that can handle the task
-        available_servers = [
-            server for server in self.servers.values()
-            if server.can_add_task(task_load)
-        ]
+        self._refresh_index()
+        # Choosing server with lowest utilization among those that can handle the task
+        best_server = self._index.first_fitting(task_load)
         
-        if not available_servers:
+        if best_server is None:
             raise ValueError(f"No server can accommodate task of size {task_load}")
         
-        # Choosing server with lowest utilization to ensure balanced distribution
-        return min(available_servers, key=lambda s: s.get_utilization())
+        return best_server
+
+    def assign_task(self, task_load: int, task_id=None) -> Server:
+        """
+        Placing a single task on the least-utilized server that can take it.
+        The load must be a whole number (see whole_task_load), and a task
+        ID, if given, must not already be assigned.
+        Returns the chosen server.
+        """
+        task_load = whole_task_load(task_load)
+        if task_id is not None and task_id in self._task_locations:
+            raise ValueError(f"Task {task_id} is already assigned.")
+        best_server = self.find_best_server_for_task(task_load)
+        if not best_server.add_task(task_load, task_id):
+            raise ValueError(f"Failed to add task of size {task_load} to selected server")
+        self._index.update(best_server)
+        if task_id is not None:
+            self._task_locations[task_id] = best_server
+        return best_server
 
-    def distribute_tasks(self, tasks: dict) -> dict:
+    def distribute_tasks(self, tasks: dict) -> DistributionView:
         """
         Distributeing tasks among servers using an improved greedy approach.
         This version focuses on maintaining balanced load across all servers.
         
         Args:
-            tasks: Dictionary mapping task identifiers to their load values
+            tasks: Dictionary mapping task identifiers to their load values,
+                whole numbers (see whole_task_load)
         Returns:
             Current distribution of tasks across all servers
         """
@@ -92,13 +308,18 @@ class LoadBalancer:
             raise ValueError("No servers available for task distribution.")
 
         # Input validation
+        loads = []
         for task_id, task_load in tasks.items():
+            task_load = whole_task_load(task_load)
             if task_load <= 0:
                 raise ValueError(f"Task load must be positive: {task_id}")
+            if task_id in self._task_locations:
+                raise ValueError(f"Task {task_id} is already assigned.")
+            loads.append((task_id, task_load))
 
         # Sorting tasks by size (largest first) for better distribution
         sorted_tasks = sorted(
-            [(task_id, load) for task_id, load in tasks.items()],
+            loads,
             key=lambda x: x[1],
             reverse=True
         )
@@ -106,59 +327,145 @@ class LoadBalancer:
         # Distributing each task to the server with lowest utilization
         for task_id, task_load in sorted_tasks:
             try:
-                best_server = self.find_best_server_for_task(task_load)
-                if not best_server.add_task(task_load):
-                    raise ValueError(f"Failed to add task {task_id} to selected server")
+                self.assign_task(task_load, task_id)
             except ValueError as e:
                 raise ValueError(f"Task distribution failed: {str(e)}")
 
         return self.get_current_distribution()
 
-    def handle_server_failure(self, failed_server: str) -> dict:
+    def handle_server_failure(self, failed_server: str) -> DistributionView:
         """
         Handling server failure by redistributing its tasks to remaining servers.
         """
-        if failed_server not in self.servers:
-            raise ValueError(f"Server {failed_server} not found.")
+        return self.handle_server_failures([failed_server])
 
-        # Storing failed server's tasks and remove it from active servers
-        failed_tasks = sorted(self.servers[failed_server].tasks, reverse=True)
-        failed_capacity = self.servers[failed_server].capacity
-        self.servers.pop(failed_server)
+    def handle_server_failures(self, failed_servers: list) -> DistributionView:
+        """
+        Handling several correlated server failures (for example a whole rack)
+        as one transaction.
 
-        if not self.servers:
+        All failed servers are taken out of the index first, then their tasks
+        are placed largest first on the remaining servers, O(k log S) for k
+        orphaned tasks. Every placement is recorded in an undo log. If any task
+        cannot be placed, the log is replayed backwards and the failed servers
+        are restored with their tasks, leaving every load as it was.
+        """
+        failed_servers = list(dict.fromkeys(failed_servers))
+        for name in failed_servers:
+            if name not in self.servers:
+                raise ValueError(f"Server {name} not found.")
+        if len(failed_servers) == len(self.servers):
             raise ValueError("No remaining servers available for task redistribution.")
 
-        # Creating redistribution tasks dictionary
-        redistribution_tasks = {
-            f"failed_task_{i}": task_load 
-            for i, task_load in enumerate(failed_tasks)
-        }
-
+        # Taking the failed servers out of the index, keeping their tasks
+        removed = [self.remove_server(name) for name in failed_servers]
+        undo_log = []
         try:
-            # Attempt to redistribute tasks
-            return self.distribute_tasks(redistribution_tasks)
+            # Sorting all orphaned tasks once, largest first
+            orphaned_tasks = sorted(
+                ((task_load, task_id) for server in removed
+                 for task_load, task_id in zip(server.tasks, server.task_ids)),
+                key=lambda x: x[0],
+                reverse=True
+            )
+            for task_load, task_id in orphaned_tasks:
+                undo_log.append(self.assign_task(task_load, task_id))
         except ValueError as e:
-            # Restoring failed server if redistribution fails
-            self.servers[failed_server] = Server(failed_server, failed_capacity)
-            for task in failed_tasks:
-                self.servers[failed_server].add_task(task)
+            # Rolling back: newest placement first, then the failed servers
+            for server in reversed(undo_log):
+                self.undo_assignment(server)
+            for server in removed:
+                self.restore_server(server)
             raise ValueError(f"Failed to redistribute tasks: {str(e)}")
 
-    def get_current_distribution(self) -> dict:
+        return self.get_current_distribution()
+
+    def get_current_distribution(self) -> DistributionView:
         """
         Get the current distribution of tasks across all servers.
-        Returns detailed information about each server's state.
-        """
-        return {
-            name: {
-                'capacity': server.capacity,
-                'current_load': server.current_load,
-                'utilization': server.get_utilization(),
-                'tasks': server.tasks
-            }
-            for name, server in sorted(self.servers.items())
-        }
+        Returns a read-only view with detailed information about each server's
+        state, built lazily instead of copying every server.
+        """
+        return DistributionView(self.servers)
+
+    def rebalance(self, max_migration_load: int) -> list:
+        """
+        Lowering the highest utilization by migrating tasks, moving at most
+        max_migration_load in total.
+
+        A max-heap of the most utilized servers and a min-heap of the least
+        utilized ones drive the moves. Each step moves one task from the most
+        utilized server to the least utilized one. It picks the task that
+        leaves the pair's higher utilization lowest, and only moves it if that
+        is below the source's current utilization. Rebalancing stops once the
+        most utilized server cannot improve or the budget is spent.
+
+        Returns:
+            List of migrations, each a dict with task_id, load, source and target
+        """
+        self._refresh_index()
+        most, least = [], []
+        for order, server in enumerate(self.servers.values()):
+            utilization = server.get_utilization()
+            most.append((-utilization, order, server))
+            least.append((utilization, order, server))
+        heapq.heapify(most)
+        heapq.heapify(least)
+        pushes = len(most)
+
+        budget = max_migration_load
+        migrations = []
+        while budget > 0:
+            source = self._heap_top(most, sign=-1)
+            target = self._heap_top(least, sign=1)
+            if source is None or target is None or source is target:
+                break
+
+            source_utilization = source.get_utilization()
+            best = None
+            for position, task_load in enumerate(source.tasks):
+                if task_load > budget or not target.can_add_task(task_load):
+                    continue
+                after = max(((source.current_load - task_load) / source.capacity) * 100,
+                            ((target.current_load + task_load) / target.capacity) * 100)
+                if after < source_utilization and (best is None or after < best[0]):
+                    best = (after, position)
+            if best is None:
+                break
+
+            task_id = source.task_ids[best[1]]
+            task_load = source.remove_task_at(best[1])
+            target.add_task(task_load, task_id)
+            if task_id is not None:
+                self._task_locations[task_id] = target
+            self._index.update(source)
+            self._index.update(target)
+            budget -= task_load
+            migrations.append({'task_id': task_id, 'load': task_load,
+                               'source': source.name, 'target': target.name})
+
+            for server in (source, target):
+                utilization = server.get_utilization()
+                pushes += 1
+                heapq.heappush(most, (-utilization, pushes, server))
+                heapq.heappush(least, (utilization, pushes, server))
+
+        return migrations
+
+    def _heap_top(self, heap: list, sign: int):
+        # Drop entries whose server left or whose utilization has changed
+        while heap:
+            key, _, server = heap[0]
+            if self.servers.get(server.name) is server and key == sign * server.get_utilization():
+                return server
+            heapq.heappop(heap)
+        return None
+
+    def _refresh_index(self):
+        # Re-key servers whose load dropped through complete_task
+        for server in self._stale:
+            self._index.update(server)
+        self._stale.clear()
 
 
 def print_distribution(distribution: dict, title: str = "Current Distribution"):
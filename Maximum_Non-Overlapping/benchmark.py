@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def write_input(path, n, seed=0, max_time=10 ** 9):
+    """Random tasks within the readme constraints, in the script input format."""
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(1, max_time, size=n, dtype=np.int64)
+    lengths = rng.integers(0, max_time // max(1, n) * 50 + 1, size=n, dtype=np.int64)
+    finishes = np.minimum(starts + lengths, max_time)
+    with open(path, 'w') as f:
+        f.write(f"{n}\n")
+        np.savetxt(f, np.column_stack((starts, finishes)), fmt='%d')
+
+
+def run_script(script, input_path):
+    start = time.perf_counter()
+    with open(input_path, 'rb') as stdin:
+        output = subprocess.run([sys.executable, os.path.join(HERE, script)], stdin=stdin,
+                                capture_output=True, check=True).stdout
+    return int(output), time.perf_counter() - start
+
+
+def main(sizes=(10 ** 5, 10 ** 6, 10 ** 7), legacy_limit=10 ** 7):
+    print(f"{'N':<12} {'solution.py (s)':<18} {'fast_solution.py (s)':<22} Answer")
+    print("-" * 64)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"tasks_{n}.txt")
+            write_input(path, n)
+
+            answer, fast_time = run_script('fast_solution.py', path)
+            legacy = "skipped"
+            if n <= legacy_limit:
+                expected, legacy_time = run_script('solution.py', path)
+                if expected != answer:
+                    raise AssertionError(f"Answers differ for N = {n}: {expected} vs {answer}")
+                legacy = f"{legacy_time:.2f}"
+            print(f"{n:<12} {legacy:<18} {fast_time:<22.2f} {answer}")
+
+
+def check_key_boundaries():
+    """
+    external_solution packs each task into a 64-bit key. Check it against
+    fast_solution on times around 2^31 and up to 2^32 - 1, where a signed key
+    would overflow.
+    """
+    from external_solution import max_non_overlapping_external
+    from fast_solution import max_non_overlapping
+
+    cases = [
+        [[0, 2 ** 31 + 5], [2 ** 31 + 10, 2 ** 31 + 20], [1, 2]],
+        [[2 ** 31 - 1, 2 ** 31], [2 ** 31, 2 ** 32 - 1], [0, 2 ** 31 - 1], [2 ** 32 - 1, 2 ** 32 - 1]],
+        [[2 ** 32 - 2, 2 ** 32 - 1], [5, 2 ** 32 - 1], [0, 5]],
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "boundaries.txt")
+        for tasks in cases:
+            with open(path, 'w') as f:
+                f.write(f"{len(tasks)}\n" + "".join(f"{s} {e}\n" for s, e in tasks))
+            starts, finishes = (np.array(column, dtype=np.int64) for column in zip(*tasks))
+            expected = max_non_overlapping(starts, finishes)
+            answer = max_non_overlapping_external(path)
+            if answer != expected:
+                raise AssertionError(f"external_solution returned {answer}, expected {expected} for {tasks}")
+    print(f"Key boundaries: {len(cases)} cases agree")
+
+
+def benchmark_weighted(n=10 ** 6, seed=0, max_time=10 ** 9):
+    """Time weighted_solution.max_weight_schedule on n random weighted tasks."""
+    from weighted_solution import max_weight_schedule
+
+    rng = np.random.default_rng(seed)
+    starts = rng.integers(1, max_time, size=n, dtype=np.int64)
+    finishes = np.minimum(starts + rng.integers(0, max_time // n * 50 + 1, size=n), max_time)
+    weights = rng.integers(1, 1000, size=n, dtype=np.int64)
+
+    start = time.perf_counter()
+    total, chosen = max_weight_schedule(starts, finishes, weights)
+    elapsed = time.perf_counter() - start
+    print(f"\nWeighted scheduling, N = {n}: {elapsed:.2f} s, "
+          f"total weight {total} from {len(chosen)} tasks")
+
+
+if __name__ == "__main__":
+    check_key_boundaries()
+    main()
+    benchmark_weighted()
@@ -0,0 +1,202 @@
+#!/bin/python3
+
+from bisect import bisect_left, bisect_right, insort
+from math import isqrt
+
+# Blocks are never cut below this many tasks
+MIN_BLOCK_SIZE = 64
+
+
+class _Block:
+    """
+    A run of tasks, contiguous in (finish, start) order, with the greedy chain
+    precomputed inside it.
+
+    For every task i, count[i] and exit[i] describe the greedy run that takes
+    task i and then continues through the rest of the block: how many tasks it
+    schedules and the finish time it leaves behind. The greedy enters a block
+    at the first task starting no earlier than the current finish time, which
+    is a bisect on the prefix maximum of the starts.
+    """
+
+    __slots__ = ('keys', 'prefix_max', 'count', 'exit')
+
+    def __init__(self, keys):
+        self.keys = keys
+        self.rebuild()
+
+    def rebuild(self):
+        keys = self.keys
+        n = len(keys)
+        self.prefix_max = prefix_max = [0] * n
+        highest = None
+        for i, (_, start) in enumerate(keys):
+            if highest is None or start > highest:
+                highest = start
+            prefix_max[i] = highest
+
+        # Walk right to left with a stack of the tasks that start later than
+        # every task between them and i; the next task the greedy takes after
+        # i is the one nearest the top that starts no earlier than i finishes
+        self.count = count = [0] * n
+        self.exit = exit_ = [0] * n
+        stack = []
+        negated_starts = []
+        for i in range(n - 1, -1, -1):
+            finish, start = keys[i]
+            k = bisect_right(negated_starts, -finish) - 1
+            if k >= 0:
+                j = stack[k]
+                count[i] = count[j] + 1
+                exit_[i] = exit_[j]
+            else:
+                count[i] = 1
+                exit_[i] = finish
+            while negated_starts and -negated_starts[-1] <= start:
+                stack.pop()
+                negated_starts.pop()
+            stack.append(i)
+            negated_starts.append(-start)
+
+    def run(self, last_finish_time):
+        # Greedy through this block, entered with the given finish time
+        i = bisect_left(self.prefix_max, last_finish_time)
+        if i == len(self.keys):
+            return 0, last_finish_time
+        return self.count[i], self.exit[i]
+
+
+class DynamicIntervalSet:
+    """
+    A multiset of tasks that answers the maximum number of non-overlapping
+    tasks while tasks are added and cancelled.
+
+    The tasks are kept in (finish, start) order, split into blocks of about
+    sqrt(n) tasks with the greedy chain precomputed inside each block. An add
+    or remove rebuilds one block in O(sqrt(n) log n). A query walks the
+    blocks with one bisect each, also O(sqrt(n) log n), and its answer is
+    cached until the next change.
+    """
+
+    def __init__(self, tasks=()):
+        keys = sorted((finish, start) for start, finish in tasks)
+        for finish, start in keys:
+            self._check_task(start, finish)
+        self._build(keys)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, task):
+        start, finish = task
+        return self._find((finish, start))[1] is not None
+
+    def add(self, start, finish):
+        """Add the task [start, finish]."""
+        self._check_task(start, finish)
+        key = (finish, start)
+        if not self._blocks:
+            self._blocks.append(_Block([key]))
+            self._maxes.append(key)
+        else:
+            b = min(bisect_left(self._maxes, key), len(self._blocks) - 1)
+            block = self._blocks[b]
+            insort(block.keys, key)
+            self._maxes[b] = block.keys[-1]
+            if len(block.keys) > 2 * self.block_size:
+                self._split(b)
+            else:
+                block.rebuild()
+        self.size += 1
+        self._rebalance()
+        self._answer = None
+
+    def remove(self, start, finish):
+        """Remove one task [start, finish]. Raises ValueError if it is absent."""
+        b, i = self._find((finish, start))
+        if i is None:
+            raise ValueError(f"Task [{start}, {finish}] is not in the set")
+        block = self._blocks[b]
+        del block.keys[i]
+        if not block.keys:
+            del self._blocks[b]
+            del self._maxes[b]
+        elif len(block.keys) < self.block_size // 2 and len(self._blocks) > 1:
+            self._merge(b)
+        else:
+            self._maxes[b] = block.keys[-1]
+            block.rebuild()
+        self.size -= 1
+        self._rebalance()
+        self._answer = None
+
+    def max_non_overlapping(self):
+        """Maximum number of non-overlapping tasks in the current set."""
+        if self._answer is None:
+            count = 0
+            last_finish_time = float('-inf')
+            for block in self._blocks:
+                taken, last_finish_time = block.run(last_finish_time)
+                count += taken
+            self._answer = count
+        return self._answer
+
+    @staticmethod
+    def _check_task(start, finish):
+        if finish < start:
+            raise ValueError(f"Task [{start}, {finish}] finishes before it starts")
+
+    def _find(self, key):
+        b = bisect_left(self._maxes, key)
+        if b == len(self._blocks):
+            return b, None
+        keys = self._blocks[b].keys
+        i = bisect_left(keys, key)
+        if i < len(keys) and keys[i] == key:
+            return b, i
+        return b, None
+
+    def _split(self, b):
+        keys = self._blocks[b].keys
+        half = len(keys) // 2
+        self._blocks[b:b + 1] = [_Block(keys[:half]), _Block(keys[half:])]
+        self._maxes[b:b + 1] = [keys[half - 1], keys[-1]]
+
+    def _merge(self, b):
+        # Fold an undersized block into a neighbour so the block count stays
+        # near sqrt(n) under long runs of removals
+        if b == len(self._blocks) - 1:
+            b -= 1
+        block = self._blocks[b]
+        block.keys += self._blocks[b + 1].keys
+        del self._blocks[b + 1]
+        del self._maxes[b + 1]
+        self._maxes[b] = block.keys[-1]
+        if len(block.keys) > 2 * self.block_size:
+            self._split(b)
+        else:
+            block.rebuild()
+
+    def _build(self, keys):
+        self.size = len(keys)
+        self.block_size = max(MIN_BLOCK_SIZE, isqrt(self.size))
+        self._blocks = [_Block(keys[i:i + self.block_size])
+                        for i in range(0, self.size, self.block_size)]
+        self._maxes = [block.keys[-1] for block in self._blocks]
+        self._answer = None
+
+    def _rebalance(self):
+        # Re-cut all blocks once the set has grown or shrunk enough that
+        # sqrt(n) is far from the block size, keeping both bounds
+        target = max(MIN_BLOCK_SIZE, isqrt(self.size))
+        if target > 2 * self.block_size or 2 * target < self.block_size:
+            self._build([key for block in self._blocks for key in block.keys])
+
+
+if __name__ == '__main__':
+    tasks = DynamicIntervalSet([(1, 3), (2, 5), (4, 6)])
+    print(tasks.max_non_overlapping())  # Output: 2
+    tasks.add(6, 7)
+    print(tasks.max_non_overlapping())  # Output: 3
+    tasks.remove(1, 3)
+    print(tasks.max_non_overlapping())  # Output: 2
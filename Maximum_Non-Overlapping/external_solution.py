@@ -0,0 +1,141 @@
+#!/bin/python3
+
+import heapq
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+from fast_solution import parse_ints
+
+# Each task is packed into one uint64 sort key: finish in the high 32 bits,
+# start in the low 32 bits, so sorting keys orders by finish, then start.
+# Unsigned keys keep finishes of 2^31 and above in order.
+KEY_SHIFT = 32
+START_MASK = (1 << KEY_SHIFT) - 1
+
+# Approximate bytes of memory per buffered task: the parsed pair and packed
+# key while a run is built, or the boxed int of a merge read buffer
+BYTES_PER_TASK = 40
+
+
+def _parse_blocks(f, block_size):
+    # Yield (starts, finishes) arrays from large text blocks, cut at a line end
+    leftover = b''
+    while True:
+        block = f.read(block_size)
+        if not block:
+            break
+        block = leftover + block
+        cut = block.rfind(b'\n') + 1
+        if cut == 0:
+            leftover = block
+            continue
+        leftover = block[cut:]
+        pairs = _pairs(block[:cut])
+        if len(pairs):
+            yield pairs[:, 0], pairs[:, 1]
+    if leftover.strip():
+        pairs = _pairs(leftover)
+        yield pairs[:, 0], pairs[:, 1]
+
+
+def _pairs(text):
+    # Whole lines of "start finish" as an (n x 2) array
+    values = parse_ints(text)
+    if len(values) % 2:
+        raise ValueError("Every task needs a start and a finish time")
+    return values.reshape(-1, 2)
+
+
+def _pack(starts, finishes):
+    if len(starts) and (min(starts.min(), finishes.min()) < 0
+                        or max(starts.max(), finishes.max()) > START_MASK):
+        raise ValueError("Start and finish times must lie in 0..2^32-1")
+    return (finishes.astype(np.uint64) << np.uint64(KEY_SHIFT)) | starts.astype(np.uint64)
+
+
+def _write_runs(path, run_capacity, block_size, tmp_dir):
+    """Split the input into sorted binary runs of at most run_capacity tasks."""
+    runs = []
+    pending = []
+    pending_size = 0
+
+    def spill(keys):
+        keys.sort()
+        run = tempfile.NamedTemporaryFile(dir=tmp_dir, suffix='.run', delete=False)
+        runs.append(run.name)
+        with run:
+            keys.tofile(run)
+
+    try:
+        with open(path, 'rb', buffering=block_size) as f:
+            n = int(f.readline())
+            seen = 0
+            for starts, finishes in _parse_blocks(f, block_size):
+                pending.append(_pack(starts, finishes))
+                pending_size += len(starts)
+                seen += len(starts)
+                while pending_size >= run_capacity:
+                    keys = np.concatenate(pending)
+                    spill(keys[:run_capacity])
+                    pending = [keys[run_capacity:]]
+                    pending_size -= run_capacity
+            if pending_size:
+                spill(np.concatenate(pending))
+
+        if seen != n:
+            raise ValueError(f"Expected {n} tasks, found {seen}")
+    except BaseException:
+        for run in runs:
+            os.remove(run)
+        raise
+    return runs
+
+
+def _read_run(path, block_items):
+    # Stream one sorted run back in large binary blocks
+    with open(path, 'rb') as f:
+        while True:
+            keys = np.fromfile(f, dtype=np.uint64, count=block_items)
+            if not len(keys):
+                return
+            yield from keys.tolist()
+
+
+def max_non_overlapping_external(path, memory_limit=256 << 20, block_size=8 << 20, tmp_dir=None):
+    """
+    Earliest-finish-time greedy for interval files larger than memory.
+
+    The input (n, then n "start finish" lines) is read in block_size chunks.
+    Up to memory_limit bytes worth of tasks are sorted at a time and written
+    to temporary binary runs. The runs are then merged with a k-way heap
+    merge that feeds the greedy scan directly, each run read back in large
+    blocks that together fit in the same budget.
+    """
+    run_capacity = max(1, memory_limit // BYTES_PER_TASK)
+    runs = _write_runs(path, run_capacity, block_size, tmp_dir)
+    try:
+        # Split the budget evenly over the run read buffers
+        block_items = max(1024, memory_limit // (BYTES_PER_TASK * max(1, len(runs))))
+        merged = heapq.merge(*(_read_run(run, block_items) for run in runs))
+
+        count = 0
+        last_finish_time = -1
+        for key in merged:
+            if key & START_MASK >= last_finish_time:
+                count += 1
+                last_finish_time = key >> KEY_SHIFT
+        return count
+    finally:
+        for run in runs:
+            os.remove(run)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python external_solution.py TASKS_FILE [MEMORY_LIMIT_MB]")
+        sys.exit(1)
+    memory_limit = int(sys.argv[2]) << 20 if len(sys.argv) == 3 else 256 << 20
+    print(max_non_overlapping_external(sys.argv[1], memory_limit))
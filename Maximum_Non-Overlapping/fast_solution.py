@@ -0,0 +1,74 @@
+#!/bin/python3
+
+import sys
+
+import numpy as np
+
+# Tasks gathered per step of the greedy scan; bounds the temporary copies
+SCAN_CHUNK = 1 << 20
+
+
+def parse_ints(data):
+    """
+    Whitespace-separated integers from bytes as an int64 array. A token that
+    is not an integer, or does not fit in 64 bits, raises ValueError naming it.
+    """
+    tokens = data.split()
+    try:
+        return np.array(tokens, dtype=np.int64)
+    except (ValueError, OverflowError):
+        pass
+    for token in tokens:
+        try:
+            np.int64(int(token))
+        except (ValueError, OverflowError):
+            raise ValueError(f"Expected a 64-bit integer, found {token.decode(errors='replace')!r}") from None
+    raise ValueError("Could not parse the input as integers")
+
+
+def read_tasks(data):
+    """
+    Parse the input format (n, then n "start finish" lines) straight from
+    bytes into two contiguous int64 arrays.
+    """
+    values = parse_ints(data)
+    if len(values) == 0:
+        raise ValueError("Expected the number of tasks, found empty input")
+    n = int(values[0])
+    if len(values) < 1 + 2 * n:
+        raise ValueError(f"Expected {n} tasks, found {(len(values) - 1) // 2}")
+    pairs = values[1:1 + 2 * n].reshape(n, 2)
+    return np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1])
+
+
+def finish_order(starts, finishes):
+    """Indices ordering the tasks by finish time, then by start time."""
+    return np.lexsort((starts, finishes))
+
+
+def max_non_overlapping(starts, finishes, order=None):
+    """
+    Earliest-finish-time greedy over int64 start/finish arrays.
+
+    The tasks are ordered once with a vectorized argsort, and the greedy then
+    walks the sorted arrays in contiguous chunks.
+    """
+    if order is None:
+        order = finish_order(starts, finishes)
+
+    count = 0
+    last_finish_time = -1
+
+    for lo in range(0, len(order), SCAN_CHUNK):
+        chunk = order[lo:lo + SCAN_CHUNK]
+        for start, finish in zip(starts[chunk].tolist(), finishes[chunk].tolist()):
+            if start >= last_finish_time:
+                count += 1
+                last_finish_time = finish
+
+    return count
+
+
+if __name__ == '__main__':
+    starts, finishes = read_tasks(sys.stdin.buffer.read())
+    print(max_non_overlapping(starts, finishes))
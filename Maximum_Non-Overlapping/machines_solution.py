@@ -0,0 +1,143 @@
+#!/bin/python3
+
+import sys
+from bisect import bisect_right
+
+import numpy as np
+
+from fast_solution import finish_order, read_tasks
+
+# Sweep event kinds at the same time, in processing order: a task ending at t
+# frees its machine before anything else happens at t, a zero-length task at
+# t only needs a machine for that instant, and tasks starting at t come last
+FINISH, INSTANT, START = 0, 1, 2
+
+# Most machines whose free times max_tasks_on_machines keeps in a plain list
+LIST_MACHINES = 4096
+
+
+def max_tasks_on_machines(starts, finishes, k, order=None):
+    """
+    Maximum number of tasks that k identical machines can run.
+
+    The tasks are taken in finish order. Each one goes to the machine that
+    became free latest but still no later than the task starts, or else to
+    an idle machine; if there is neither the task is dropped.
+
+    Up to LIST_MACHINES machines, the free times are kept as a sorted list:
+    one bisect per task, and deleting from a list that short is a memmove
+    cheaper than any tree walk. More machines would make each deletion an
+    O(k) shift, so the free times go into a Fenwick tree over the distinct
+    finish times instead, O(log n) per task. Either way the sort dominates,
+    O(n log n) in total.
+    """
+    if k < 1:
+        raise ValueError("Number of machines must be positive")
+    if order is None:
+        order = finish_order(starts, finishes)
+    if k > LIST_MACHINES:
+        # A fleet that large often fits every task; one vectorized sweep
+        # tells, and is cheaper than the tree
+        if min_machines(starts, finishes) <= k:
+            return len(starts)
+        return _max_tasks_fenwick(starts[order], finishes[order], k)
+
+    # Tasks arrive in finish order, so a new free time is never smaller than
+    # the ones already listed and can simply be appended
+    free_times = []
+    idle = k
+    count = 0
+    for start, finish in zip(starts[order].tolist(), finishes[order].tolist()):
+        machine = bisect_right(free_times, start) - 1
+        if machine >= 0:
+            del free_times[machine]
+        elif idle:
+            idle -= 1
+        else:
+            continue
+        free_times.append(finish)
+        count += 1
+
+    return count
+
+
+def _max_tasks_fenwick(starts, finishes, k):
+    """
+    max_tasks_on_machines for tasks already in finish order, with the free
+    times of busy machines counted in a Fenwick tree indexed by finish time.
+    """
+    times = np.unique(finishes)
+    size = len(times)
+    # Busy machines free by a task's start sit in slots 1..ready
+    ready = np.searchsorted(times, starts, side='right').tolist()
+    slots = (np.searchsorted(times, finishes) + 1).tolist()
+    tree = [0] * (size + 1)
+    top = 1 << size.bit_length()
+
+    idle = k
+    count = 0
+    for ready_slots, slot in zip(ready, slots):
+        free = 0
+        i = ready_slots
+        while i:
+            free += tree[i]
+            i &= i - 1
+        if free:
+            # Descend to the slot of the free-th free time, the latest one
+            # no later than the start, and take that machine
+            i = 0
+            step = top
+            while step:
+                if i + step <= size and tree[i + step] < free:
+                    i += step
+                    free -= tree[i]
+                step >>= 1
+            i += 1
+            while i <= size:
+                tree[i] -= 1
+                i += i & -i
+        elif idle:
+            idle -= 1
+        else:
+            continue
+        i = slot
+        while i <= size:
+            tree[i] += 1
+            i += i & -i
+        count += 1
+
+    return count
+
+
+def min_machines(starts, finishes):
+    """
+    Minimum number of machines needed to run every task, in O(n log n).
+
+    A sweep over the start and finish events, sorted with one np.lexsort,
+    tracks how many tasks run at once. Tasks ending at t free their machine
+    before tasks starting at t claim one. A zero-length task at t needs a
+    machine only at that instant, so it counts towards the peak but holds
+    nothing afterwards.
+    """
+    if len(starts) == 0:
+        return 0
+    instant = starts == finishes
+    timed = ~instant
+
+    times = np.concatenate((finishes[timed], starts[instant], starts[timed]))
+    kinds = np.concatenate((np.full(np.count_nonzero(timed), FINISH, dtype=np.int8),
+                            np.full(np.count_nonzero(instant), INSTANT, dtype=np.int8),
+                            np.full(np.count_nonzero(timed), START, dtype=np.int8)))
+    events = np.lexsort((kinds, times))
+    kinds = kinds[events]
+
+    # FINISH, INSTANT and START map to -1, 0 and +1 running tasks
+    running = np.cumsum(kinds.astype(np.int64) - 1)
+    return int((running + (kinds == INSTANT)).max())
+
+
+if __name__ == '__main__':
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    starts, finishes = read_tasks(sys.stdin.buffer.read())
+    print(max_tasks_on_machines(starts, finishes, k))
+    print(min_machines(starts, finishes))
@@ -6,16 +6,11 @@ import random
 import re
 import sys
 
-if __name__ == '__main__':
-    n = int(input().strip())
 
-    tasks = []
-
-    for _ in range(n):
-        tasks.append(list(map(int, input().rstrip().split())))
-
-    # Write your code here
-    tasks.sort(key=lambda x: x[1])
+def max_non_overlapping(tasks):
+    # Earliest finish first; among equal finishes take earlier starts first,
+    # so zero-length tasks at time t still fit after a task ending at t
+    tasks.sort(key=lambda x: (x[1], x[0]))
 
     count = 0
     last_finish_time = -1
@@ -26,4 +21,15 @@ if __name__ == '__main__':
             count += 1
             last_finish_time = finish
 
-    print(count)
+    return count
+
+
+if __name__ == '__main__':
+    n = int(input().strip())
+
+    tasks = []
+
+    for _ in range(n):
+        tasks.append(list(map(int, input().rstrip().split())))
+
+    print(max_non_overlapping(tasks))
@@ -0,0 +1,73 @@
+#!/bin/python3
+
+import sys
+
+import numpy as np
+
+from fast_solution import finish_order, parse_ints
+
+
+def read_weighted_tasks(data):
+    """Parse n, then n "start finish weight" lines, into three int64 arrays."""
+    values = parse_ints(data)
+    if len(values) == 0:
+        raise ValueError("Expected the number of tasks, found empty input")
+    n = int(values[0])
+    if len(values) < 1 + 3 * n:
+        raise ValueError(f"Expected {n} tasks, found {(len(values) - 1) // 3}")
+    triples = values[1:1 + 3 * n].reshape(n, 3)
+    return (np.ascontiguousarray(triples[:, 0]), np.ascontiguousarray(triples[:, 1]),
+            np.ascontiguousarray(triples[:, 2]))
+
+
+def max_weight_schedule(starts, finishes, weights):
+    """
+    Weighted interval scheduling in O(n log n) time and O(n) memory.
+
+    Tasks are ordered by finish time exactly as in fast_solution.py. For each
+    task, np.searchsorted finds the last earlier task that finishes by its
+    start. The DP then keeps the best total weight of the first j tasks.
+
+    Returns (best total weight, indices of the chosen tasks in finish order).
+    """
+    n = len(starts)
+    if n == 0:
+        return 0, []
+
+    order = finish_order(starts, finishes)
+    sorted_starts = starts[order]
+    sorted_finishes = finishes[order]
+
+    # predecessor[j]: last task before j (in finish order) ending by start j,
+    # or -1. Only tasks before j count, which matters for zero-length tasks.
+    predecessor = np.searchsorted(sorted_finishes, sorted_starts, side='right') - 1
+    np.minimum(predecessor, np.arange(-1, n - 1), out=predecessor)
+
+    # best[j + 1]: best total weight using the first j + 1 tasks
+    best = [0] * (n + 1)
+    take = bytearray(n)
+    for j, (p, w) in enumerate(zip(predecessor.tolist(), weights[order].tolist())):
+        with_task = w + best[p + 1]
+        if with_task > best[j]:
+            best[j + 1] = with_task
+            take[j] = 1
+        else:
+            best[j + 1] = best[j]
+
+    chosen = []
+    j = n - 1
+    while j >= 0:
+        if take[j]:
+            chosen.append(int(order[j]))
+            j = int(predecessor[j])
+        else:
+            j -= 1
+    chosen.reverse()
+    return best[n], chosen
+
+
+if __name__ == '__main__':
+    starts, finishes, weights = read_weighted_tasks(sys.stdin.buffer.read())
+    total, chosen = max_weight_schedule(starts, finishes, weights)
+    print(total)
+    print(' '.join(map(str, chosen)))
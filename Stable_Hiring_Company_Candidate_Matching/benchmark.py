@@ -0,0 +1,111 @@
+import random
+import time
+
+from capacitated_matching import capacitated_match
+from stable_matching import stable_match
+
+
+def legacy_stable_match(company_prefs, candidate_prefs):
+    # The original loop: list.index() rank lookups and list.pop(0), O(n^3)
+    n = len(company_prefs)
+    candidate_match = [-1] * n
+    next_proposal_index = [0] * n
+    free_companies = list(range(n))
+
+    while free_companies:
+        company = free_companies[0]
+        candidate = company_prefs[company][next_proposal_index[company]]
+        next_proposal_index[company] += 1
+
+        if candidate_match[candidate] == -1:
+            candidate_match[candidate] = company
+            free_companies.pop(0)
+        else:
+            current_company = candidate_match[candidate]
+            current_rank = candidate_prefs[candidate].index(current_company)
+            new_rank = candidate_prefs[candidate].index(company)
+
+            if new_rank < current_rank:
+                candidate_match[candidate] = company
+                free_companies.pop(0)
+                free_companies.append(current_company)
+
+    return candidate_match
+
+
+def worst_case_instance(n, seed=0):
+    """
+    Every company ranks the candidates identically, which forces about n^2 / 2
+    proposals, and every candidate has a random list.
+    """
+    rng = random.Random(seed)
+    order = list(range(n))
+    company_prefs = [order] * n
+    candidate_prefs = []
+    for _ in range(n):
+        prefs = order[:]
+        rng.shuffle(prefs)
+        candidate_prefs.append(prefs)
+    return company_prefs, candidate_prefs
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def capacitated_instance(num_candidates, num_companies, list_length=20, seed=0):
+    """
+    Each candidate lists list_length random companies. Each company ranks,
+    in random order, exactly the candidates who listed it. Quotas add up to
+    the number of candidates.
+    """
+    rng = random.Random(seed)
+    candidate_prefs = [rng.sample(range(num_companies), list_length) for _ in range(num_candidates)]
+
+    company_prefs = [[] for _ in range(num_companies)]
+    for candidate, prefs in enumerate(candidate_prefs):
+        for company in prefs:
+            company_prefs[company].append(candidate)
+    for prefs in company_prefs:
+        rng.shuffle(prefs)
+
+    quotas = [num_candidates // num_companies] * num_companies
+    return company_prefs, candidate_prefs, quotas
+
+
+def benchmark_one_to_one(sizes=(250, 500, 1000, 2000, 5000, 8000), legacy_limit=1000):
+    print(f"{'n':<8} {'stable_match (s)':<18} legacy (s)")
+    print("-" * 40)
+    for n in sizes:
+        company_prefs, candidate_prefs = worst_case_instance(n)
+        result, elapsed = time_call(stable_match, company_prefs, candidate_prefs)
+
+        legacy = "skipped"
+        if n <= legacy_limit:
+            expected, legacy_time = time_call(legacy_stable_match, company_prefs, candidate_prefs)
+            if expected != result:
+                raise AssertionError(f"Matchings differ for n = {n}")
+            legacy = f"{legacy_time:.3f}"
+        print(f"{n:<8} {elapsed:<18.3f} {legacy}")
+
+
+def benchmark_capacitated(sizes=(10 ** 4, 10 ** 5), num_companies=1000):
+    print(f"\n{'Candidates':<12} {'Companies':<12} {'Time (s)':<10} {'Matched':<10} Candidates/s")
+    print("-" * 60)
+    for num_candidates in sizes:
+        company_prefs, candidate_prefs, quotas = capacitated_instance(num_candidates, num_companies)
+        (candidate_match, _), elapsed = time_call(capacitated_match, company_prefs, candidate_prefs, quotas)
+        matched = sum(1 for company in candidate_match if company != -1)
+        print(f"{num_candidates:<12} {num_companies:<12} {elapsed:<10.3f} {matched:<10} "
+              f"{num_candidates / elapsed:,.0f}")
+
+
+def main():
+    benchmark_one_to_one()
+    benchmark_capacitated()
+
+
+if __name__ == "__main__":
+    main()
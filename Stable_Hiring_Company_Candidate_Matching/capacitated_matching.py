@@ -0,0 +1,80 @@
+import heapq
+from collections import deque
+
+
+def capacitated_match(company_prefs, candidate_prefs, quotas):
+    """
+    Many-to-one stable matching (hospitals/residents) with company quotas.
+
+    Candidates propose in order of preference and each company holds on to
+    its best quotas[company] offers. A company's current hires sit in a heap
+    keyed by the company's rank for each of them, so finding and replacing
+    its worst hire costs O(log q).
+
+    The numbers of companies and candidates may differ, and preference lists
+    may be incomplete. A pair can only be matched if each side lists the other.
+
+    Returns (candidate_match, hires). candidate_match[candidate] is the hiring
+    company, or -1 if the candidate stays unmatched. hires[company] lists the
+    company's hires from most to least preferred.
+    """
+    num_companies = len(company_prefs)
+    num_candidates = len(candidate_prefs)
+    if len(quotas) != num_companies:
+        raise ValueError("Every company needs a quota.")
+
+    # company_rank[company][candidate] = position of candidate in company's list
+    company_rank = [
+        {candidate: position for position, candidate in enumerate(prefs)}
+        for prefs in company_prefs
+    ]
+
+    # Max-heaps of (-rank, candidate): the worst current hire is on top
+    hires = [[] for _ in range(num_companies)]
+    candidate_match = [-1] * num_candidates
+    next_proposal_index = [0] * num_candidates
+    free_candidates = deque(range(num_candidates))
+
+    while free_candidates:
+        candidate = free_candidates.popleft()
+        prefs = candidate_prefs[candidate]
+
+        while next_proposal_index[candidate] < len(prefs):
+            company = prefs[next_proposal_index[candidate]]
+            next_proposal_index[candidate] += 1
+
+            rank = company_rank[company].get(candidate)
+            if rank is None:
+                continue  # The company does not consider this candidate
+
+            heap = hires[company]
+            if len(heap) < quotas[company]:
+                heapq.heappush(heap, (-rank, candidate))
+                candidate_match[candidate] = company
+                break
+            if heap and -heap[0][0] > rank:
+                # Replace the worst current hire, who goes back to proposing
+                _, replaced = heapq.heapreplace(heap, (-rank, candidate))
+                candidate_match[replaced] = -1
+                free_candidates.append(replaced)
+                candidate_match[candidate] = company
+                break
+
+    return candidate_match, [
+        [candidate for _, candidate in sorted(heap, reverse=True)]
+        for heap in hires
+    ]
+
+
+if __name__ == '__main__':
+    # 2 companies with quotas 2 and 1, 4 candidates; candidate 3 only
+    # considers company 1, and company 0 does not consider candidate 2
+    company_prefs = [[0, 1, 3], [2, 0, 1, 3]]
+    candidate_prefs = [[1, 0], [0, 1], [0, 1], [1]]
+    quotas = [2, 1]
+
+    candidate_match, hires = capacitated_match(company_prefs, candidate_prefs, quotas)
+    for candidate, company in enumerate(candidate_match):
+        print(candidate, company)
+    for company, hired in enumerate(hires):
+        print(f"Company {company}: {hired}")
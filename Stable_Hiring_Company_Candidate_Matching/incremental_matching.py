@@ -0,0 +1,267 @@
+import heapq
+from collections import deque
+
+from capacitated_matching import capacitated_match
+from stable_matching import stable_match
+
+
+class IncrementalMatcher:
+    """
+    Keeps a stable matching up to date while preferences, participants and
+    quotas change, without re-running Gale-Shapley from scratch.
+
+    Works for the many-to-one model of capacitated_match. With every quota
+    left at 1 it is the one-to-one problem of stable_match. Each update
+    frees only the agents it touches and then repairs stability in two phases:
+
+    1. Companies with open slots make offers down their lists. A company that
+       was full only needs to start after its former worst hire, since in a
+       stable matching every candidate it ranks higher prefers their own match.
+       Candidates only accept offers they prefer, so candidates only improve.
+       Candidates freed by the update are skipped here.
+    2. Deferred acceptance resumes from the current matching. Each free
+       candidate takes the best company on its list that would accept it.
+       A full company evicts its worst hire for that, and the evicted
+       candidate becomes free. Companies only improve.
+
+    A stable matching is a valid intermediate state of candidate-proposing
+    deferred acceptance. Phase 1 restores that state around the companies the
+    update disturbed, and phase 2 finishes the run.
+
+    The repaired matching is stable, but after a change it is not necessarily
+    the company- or candidate-optimal one. Work is proportional to the
+    preference lists scanned by the freed agents; `proposals` counts the offers made.
+    """
+
+    def __init__(self, company_prefs, candidate_prefs, quotas=None, candidate_match=None):
+        self.company_prefs = [list(prefs) for prefs in company_prefs]
+        self.candidate_prefs = [list(prefs) for prefs in candidate_prefs]
+        self.quotas = list(quotas) if quotas is not None else [1] * len(self.company_prefs)
+        if candidate_match is None:
+            candidate_match, _ = capacitated_match(self.company_prefs, self.candidate_prefs, self.quotas)
+        self.candidate_match = list(candidate_match)
+
+        self.company_rank = [self._rank(prefs) for prefs in self.company_prefs]
+        self.candidate_rank = [self._rank(prefs) for prefs in self.candidate_prefs]
+
+        # Hires per company, plus a max-heap of (-rank, candidate) to find the
+        # worst hire. Entries go stale when a hire leaves and are skipped lazily.
+        self._hires = [set() for _ in self.company_prefs]
+        self._heaps = [[] for _ in self.company_prefs]
+        for candidate, company in enumerate(self.candidate_match):
+            if company != -1:
+                self._hires[company].add(candidate)
+                heapq.heappush(self._heaps[company], (-self.company_rank[company][candidate], candidate))
+
+        # Position in each company's list from which it still has to make offers
+        self._frontier = [len(prefs) for prefs in self.company_prefs]
+
+        self._free_companies = deque()
+        self._free_candidates = deque()
+        self._pending = set()
+        self._before = {}
+        self.proposals = 0
+
+    @staticmethod
+    def _rank(prefs):
+        return {agent: position for position, agent in enumerate(prefs)}
+
+    def hires(self, company):
+        """Return the company's hires from most to least preferred."""
+        return sorted(self._hires[company], key=self.company_rank[company].__getitem__)
+
+    # Updates. Each one returns {candidate: new company} for every candidate
+    # whose match changed (-1 when left unmatched).
+
+    def update_company_prefs(self, company, prefs):
+        self._begin()
+        self._release_company(company)
+        self.company_prefs[company] = list(prefs)
+        self.company_rank[company] = self._rank(prefs)
+        self._frontier[company] = 0
+        self._free_companies.append(company)
+        return self._finish()
+
+    def update_candidate_prefs(self, candidate, prefs):
+        self._begin()
+        self._release_candidate(candidate)
+        self.candidate_prefs[candidate] = list(prefs)
+        self.candidate_rank[candidate] = self._rank(prefs)
+        self._free(candidate)
+        return self._finish()
+
+    def set_quota(self, company, quota):
+        if quota < 0:
+            raise ValueError("Quota must not be negative.")
+        self._begin()
+        if quota > self.quotas[company]:
+            self._open_slot(company)
+        self.quotas[company] = quota
+        while len(self._hires[company]) > quota:
+            self._evict(self._worst(company)[1])
+        return self._finish()
+
+    def add_company(self, prefs, quota=1):
+        """Add a company. Returns (company index, changes)."""
+        self._begin()
+        company = len(self.company_prefs)
+        self.company_prefs.append(list(prefs))
+        self.company_rank.append(self._rank(prefs))
+        self.quotas.append(quota)
+        self._hires.append(set())
+        self._heaps.append([])
+        self._frontier.append(0)
+        self._free_companies.append(company)
+        return company, self._finish()
+
+    def add_candidate(self, prefs):
+        """Add a candidate. Returns (candidate index, changes)."""
+        self._begin()
+        candidate = len(self.candidate_prefs)
+        self.candidate_prefs.append(list(prefs))
+        self.candidate_rank.append(self._rank(prefs))
+        self.candidate_match.append(-1)
+        self._free(candidate)
+        return candidate, self._finish()
+
+    def remove_company(self, company):
+        # The index stays reserved; the company simply accepts nobody
+        self._begin()
+        self._release_company(company)
+        self.company_prefs[company] = []
+        self.company_rank[company] = {}
+        self.quotas[company] = 0
+        return self._finish()
+
+    def remove_candidate(self, candidate):
+        self._begin()
+        self._release_candidate(candidate)
+        self.candidate_prefs[candidate] = []
+        self.candidate_rank[candidate] = {}
+        return self._finish()
+
+    # Bookkeeping
+
+    def _begin(self):
+        self._before = {}
+
+    def _finish(self):
+        self._propose_from_companies()
+        self._propose_from_candidates()
+        return {
+            candidate: self.candidate_match[candidate]
+            for candidate, before in self._before.items()
+            if self.candidate_match[candidate] != before
+        }
+
+    def _set_match(self, candidate, company):
+        self._before.setdefault(candidate, self.candidate_match[candidate])
+        self.candidate_match[candidate] = company
+
+    def _assign(self, candidate, company):
+        current = self.candidate_match[candidate]
+        if current != -1:
+            self._open_slot(current)
+            self._hires[current].discard(candidate)
+        self._set_match(candidate, company)
+        self._hires[company].add(candidate)
+        heapq.heappush(self._heaps[company], (-self.company_rank[company][candidate], candidate))
+
+    def _evict(self, candidate):
+        # The company keeps its slot for a better candidate, so it is not freed
+        self._hires[self.candidate_match[candidate]].discard(candidate)
+        self._set_match(candidate, -1)
+        self._free(candidate)
+
+    def _free(self, candidate):
+        self._free_candidates.append(candidate)
+        self._pending.add(candidate)
+
+    def _release_candidate(self, candidate):
+        company = self.candidate_match[candidate]
+        if company != -1:
+            self._open_slot(company)
+            self._hires[company].discard(candidate)
+            self._set_match(candidate, -1)
+
+    def _release_company(self, company):
+        for candidate in self._hires[company]:
+            self._set_match(candidate, -1)
+            self._free(candidate)
+        self._hires[company] = set()
+        self._heaps[company] = []
+
+    def _open_slot(self, company):
+        # Called before a full company loses a hire or gains quota
+        if len(self._hires[company]) >= self.quotas[company]:
+            worst = self._worst(company)
+            self._frontier[company] = worst[0] + 1 if worst else 0
+        self._free_companies.append(company)
+
+    def _worst(self, company):
+        heap = self._heaps[company]
+        while heap and self.candidate_match[heap[0][1]] != company:
+            heapq.heappop(heap)
+        return (-heap[0][0], heap[0][1]) if heap else None
+
+    # Repair phases
+
+    def _propose_from_companies(self):
+        while self._free_companies:
+            company = self._free_companies.popleft()
+            prefs = self.company_prefs[company]
+            quota = self.quotas[company]
+            hired = self._hires[company]
+
+            position = self._frontier[company]
+            while position < len(prefs) and len(hired) < quota:
+                candidate = prefs[position]
+                position += 1
+                current = self.candidate_match[candidate]
+                if current == company or candidate in self._pending:
+                    continue
+                rank = self.candidate_rank[candidate].get(company)
+                if rank is None:
+                    continue  # The candidate does not consider this company
+
+                self.proposals += 1
+                if current == -1 or rank < self.candidate_rank[candidate][current]:
+                    self._assign(candidate, company)
+            self._frontier[company] = position
+
+    def _propose_from_candidates(self):
+        while self._free_candidates:
+            candidate = self._free_candidates.popleft()
+            self._pending.discard(candidate)
+            if self.candidate_match[candidate] != -1:
+                continue  # Queued twice and already placed
+
+            for company in self.candidate_prefs[candidate]:
+                rank = self.company_rank[company].get(candidate)
+                if rank is None:
+                    continue  # The company does not consider this candidate
+
+                self.proposals += 1
+                if len(self._hires[company]) < self.quotas[company]:
+                    self._assign(candidate, company)
+                    break
+                worst = self._worst(company)
+                if worst is not None and worst[0] > rank:
+                    self._evict(worst[1])
+                    self._assign(candidate, company)
+                    break
+
+
+if __name__ == '__main__':
+    # Sample input 0 from the readme
+    company_prefs = [[2, 1, 0], [1, 2, 0], [0, 1, 2]]
+    candidate_prefs = [[0, 1, 2], [1, 0, 2], [2, 0, 1]]
+
+    # Warm-start from the company-optimal matching
+    previous = stable_match(company_prefs, candidate_prefs)
+    matcher = IncrementalMatcher(company_prefs, candidate_prefs, candidate_match=previous)
+    print(matcher.candidate_match)  # [2, 1, 0]
+
+    # Candidate 0 withdraws; only the affected agents re-propose
+    print(matcher.remove_candidate(0))
+    print(matcher.candidate_match, f"{matcher.proposals} proposals")
@@ -0,0 +1,106 @@
+import mmap
+import struct
+import sys
+from array import array
+
+# Header: magic, format version, bytes per entry, n. 16 bytes keeps the
+# matrices aligned for int16 and int32 views.
+HEADER = struct.Struct('<4sHHQ')
+MAGIC = b'GSPF'
+VERSION = 1
+
+
+def typecode_for(n):
+    """Smallest array typecode that can hold indices 0..n-1."""
+    return 'h' if n <= 2 ** 15 else 'i'
+
+
+def convert_text(in_stream, out_path):
+    """
+    Convert the text input format (n, then n company rows, then n candidate
+    rows) into the binary preference format.
+
+    Rows are parsed and written one at a time, so memory stays O(n).
+    The file holds the header, then the company matrix, then the candidate
+    matrix, both row-major and little-endian.
+    """
+    n = int(in_stream.readline().strip())
+    typecode = typecode_for(n)
+    itemsize = array(typecode).itemsize
+
+    with open(out_path, 'wb') as out:
+        out.write(HEADER.pack(MAGIC, VERSION, itemsize, n))
+        for row_index in range(2 * n):
+            row = array(typecode, map(int, in_stream.readline().split()))
+            if len(row) != n:
+                raise ValueError(f"Preference row {row_index} has {len(row)} entries, expected {n}")
+            if sys.byteorder != 'little':
+                row.byteswap()
+            row.tofile(out)
+    return n
+
+
+class PreferenceFile:
+    """
+    Memory-mapped view of a binary preference file.
+
+    company_prefs and candidate_prefs are lists of per-row memoryviews into
+    the mapping. They can be passed straight to stable_match, and only the
+    pages holding rows that are actually read get loaded.
+    """
+
+    def __init__(self, path):
+        if sys.byteorder != 'little':
+            raise ValueError("Binary preference files require a little-endian host")
+
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # An empty file cannot be mapped
+            self._file.close()
+            raise ValueError(f"{path} is too short for a preference file header") from None
+        except OSError:
+            self._file.close()
+            raise
+
+        if len(self._map) < HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is too short for a preference file header")
+        magic, version, itemsize, n = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != VERSION or itemsize not in (2, 4):
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} preference file")
+        if len(self._map) != HEADER.size + 2 * n * n * itemsize:
+            self.close()
+            raise ValueError(f"{path} is truncated or has trailing data")
+
+        self.n = n
+        self._matrix = memoryview(self._map)[HEADER.size:].cast('h' if itemsize == 2 else 'i')
+        self.company_prefs = [self._matrix[row * n:(row + 1) * n] for row in range(n)]
+        self.candidate_prefs = [self._matrix[row * n:(row + 1) * n] for row in range(n, 2 * n)]
+
+    def close(self):
+        # Every view must be released before the mapping can be closed
+        for row in getattr(self, 'company_prefs', []) + getattr(self, 'candidate_prefs', []):
+            row.release()
+        self.company_prefs = self.candidate_prefs = []
+        if getattr(self, '_matrix', None) is not None:
+            self._matrix.release()
+            self._matrix = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print("Usage: python preference_format.py OUTPUT.bin < input.txt")
+        sys.exit(1)
+    n = convert_text(sys.stdin, sys.argv[1])
+    print(f"Wrote {n} x {n} company and candidate matrices to {sys.argv[1]}")
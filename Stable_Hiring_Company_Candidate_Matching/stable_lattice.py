@@ -0,0 +1,393 @@
+from array import array
+from collections import deque
+
+from stable_matching import stable_match
+
+
+class StableLattice:
+    """
+    The lattice of all stable matchings for complete one-to-one preferences,
+    represented by its rotation poset.
+
+    A rotation is a cycle (c0, k0), ..., (cr-1, kr-1) of matched pairs. When
+    it is eliminated, every company ci moves down to k(i+1). Starting from the
+    company-optimal matching, eliminating the rotations of any closed subset
+    of the poset gives a stable matching. Every stable matching arises from
+    exactly one closed subset, and eliminating all rotations gives the
+    candidate-optimal matching.
+
+    The rotations and their precedence edges are found in O(n^2) after the
+    two Gale-Shapley runs.
+    """
+
+    def __init__(self, company_prefs, candidate_prefs):
+        self.n = n = len(company_prefs)
+        self.company_prefs = company_prefs
+        self.candidate_prefs = candidate_prefs
+
+        # rank tables: company_rank[c][k] and candidate_rank[k][c]
+        self.company_rank = [self._rank(prefs) for prefs in company_prefs]
+        self.candidate_rank = [self._rank(prefs) for prefs in candidate_prefs]
+
+        self.company_optimal = stable_match(company_prefs, candidate_prefs)
+        # With the roles swapped, stable_match maps each company to its candidate
+        candidate_optimal_company_match = stable_match(candidate_prefs, company_prefs)
+        self.candidate_optimal = [-1] * n
+        for company, candidate in enumerate(candidate_optimal_company_match):
+            self.candidate_optimal[candidate] = company
+
+        self.rotations = []
+        self.predecessors = []
+        self._find_rotations(candidate_optimal_company_match)
+        self.weights = [self._weight(rotation) for rotation in self.rotations]
+
+    def _rank(self, prefs):
+        table = array('i', [0]) * self.n
+        for position, agent in enumerate(prefs):
+            table[agent] = position
+        return table
+
+    def _find_rotations(self, target):
+        n = self.n
+        company_match = [-1] * n
+        for candidate, company in enumerate(self.company_optimal):
+            company_match[company] = candidate
+        candidate_match = list(self.company_optimal)
+
+        # scan[c]: next position in c's list that might still accept c.
+        # Candidates only improve, so scans never move backwards.
+        scan = [self.company_rank[c][company_match[c]] + 1 for c in range(n)]
+
+        def next_company(c):
+            # s(c) is the first candidate after c's partner who prefers c to
+            # their own partner; the rotation edge leads to their partner
+            prefs = self.company_prefs[c]
+            position = scan[c]
+            while True:
+                candidate = prefs[position]
+                if self.candidate_rank[candidate][c] < self.candidate_rank[candidate][candidate_match[candidate]]:
+                    scan[c] = position
+                    return candidate_match[candidate]
+                position += 1
+
+        # crossed[k][c]: rotation that moved k from a company below c to one above c
+        crossed = [array('i', [-1]) * n for _ in range(n)]
+        # moved_to[c]: rotation that last moved company c, i.e. gave it its current partner
+        moved_to = [-1] * n
+        type1 = []
+
+        stack = []
+        on_stack = [False] * n
+        for start in range(n):
+            while company_match[start] != target[start]:
+                if not stack:
+                    stack.append(start)
+                    on_stack[start] = True
+                following = next_company(stack[-1])
+                if not on_stack[following]:
+                    stack.append(following)
+                    on_stack[following] = True
+                    continue
+
+                # The stack closes a cycle: pop it off as a rotation
+                companies = []
+                while True:
+                    company = stack.pop()
+                    on_stack[company] = False
+                    companies.append(company)
+                    if company == following:
+                        break
+                companies.reverse()
+                rotation = [(company, company_match[company]) for company in companies]
+                index = len(self.rotations)
+                self.rotations.append(rotation)
+                type1.append({moved_to[company] for company in companies} - {-1})
+
+                # Eliminate it: ci moves to k(i+1), which moves up from c(i+1) to ci
+                size = len(rotation)
+                for i, (company, _) in enumerate(rotation):
+                    next_owner, candidate = rotation[(i + 1) % size]
+                    prefs = self.candidate_prefs[candidate]
+                    for position in range(self.candidate_rank[candidate][company] + 1,
+                                          self.candidate_rank[candidate][next_owner]):
+                        crossed[candidate][prefs[position]] = index
+                for i, (company, _) in enumerate(rotation):
+                    candidate = rotation[(i + 1) % size][1]
+                    company_match[company] = candidate
+                    candidate_match[candidate] = company
+                    moved_to[company] = index
+                    scan[company] = self.company_rank[company][candidate] + 1
+
+        # Precedence edges: the rotation that gave ci the partner ki (type 1),
+        # and for every candidate ci skips over, the rotation that lifted
+        # them above ci (type 2)
+        for index, rotation in enumerate(self.rotations):
+            preds = type1[index]
+            size = len(rotation)
+            for i, (company, candidate) in enumerate(rotation):
+                new_candidate = rotation[(i + 1) % size][1]
+                prefs = self.company_prefs[company]
+                for position in range(self.company_rank[company][candidate] + 1,
+                                      self.company_rank[company][new_candidate]):
+                    lifted_by = crossed[prefs[position]][company]
+                    if lifted_by != -1:
+                        preds.add(lifted_by)
+            preds.discard(index)
+            self.predecessors.append(preds)
+
+    def _weight(self, rotation):
+        # Change in total rank (companies plus candidates) when eliminated
+        weight = 0
+        size = len(rotation)
+        for i, (company, candidate) in enumerate(rotation):
+            next_owner, next_candidate = rotation[(i + 1) % size]
+            weight += self.company_rank[company][next_candidate] - self.company_rank[company][candidate]
+            weight += (self.candidate_rank[next_candidate][company]
+                       - self.candidate_rank[next_candidate][next_owner])
+        return weight
+
+    def _apply(self, candidate_match, index):
+        rotation = self.rotations[index]
+        size = len(rotation)
+        for i, (company, _) in enumerate(rotation):
+            candidate_match[rotation[(i + 1) % size][1]] = company
+
+    def _undo(self, candidate_match, index):
+        for company, candidate in self.rotations[index]:
+            candidate_match[candidate] = company
+
+    def matching_for(self, rotations):
+        """Matching obtained by eliminating a closed set of rotation indices."""
+        candidate_match = list(self.company_optimal)
+        for index in sorted(rotations):
+            self._apply(candidate_match, index)
+        return candidate_match
+
+    def cost(self, candidate_match):
+        """Egalitarian cost: sum of every agent's rank of their partner."""
+        return sum(
+            self.candidate_rank[candidate][company] + self.company_rank[company][candidate]
+            for candidate, company in enumerate(candidate_match)
+        )
+
+    def matchings(self):
+        """
+        Lazily yield every stable matching as a candidate_match list, starting
+        with the company-optimal one.
+
+        Rotations are discovered in an order compatible with the poset, so a
+        depth-first include/exclude search over them never hits a dead end.
+        The delay between two matchings is O(R + n) for R rotations.
+        """
+        count = len(self.rotations)
+        candidate_match = list(self.company_optimal)
+        included = [False] * count
+        choices = []
+        position = 0
+
+        while True:
+            while position < count:
+                choices.append(False)
+                position += 1
+            yield list(candidate_match)
+
+            # Backtrack to the deepest rotation that can still be switched on
+            while choices:
+                position -= 1
+                if choices.pop():
+                    self._undo(candidate_match, position)
+                    included[position] = False
+                elif all(included[p] for p in self.predecessors[position]):
+                    self._apply(candidate_match, position)
+                    included[position] = True
+                    choices.append(True)
+                    position += 1
+                    break
+            else:
+                return
+
+    def egalitarian(self):
+        """
+        Stable matching with the smallest total rank, found as a minimum-weight
+        closed set of the rotation poset via a single min cut.
+
+        Returns (candidate_match, cost).
+        """
+        count = len(self.rotations)
+        source, sink = count, count + 1
+        graph = _FlowNetwork(count + 2)
+        infinite = sum(abs(weight) for weight in self.weights) + 1
+
+        for index, weight in enumerate(self.weights):
+            if weight < 0:
+                graph.add_edge(source, index, -weight)
+            elif weight > 0:
+                graph.add_edge(index, sink, weight)
+            for pred in self.predecessors[index]:
+                graph.add_edge(index, pred, infinite)
+
+        graph.max_flow(source, sink)
+        chosen = [index for index in graph.reachable(source) if index < count]
+        candidate_match = self.matching_for(chosen)
+        return candidate_match, self.cost(candidate_match)
+
+    def minimum_regret(self):
+        """
+        Stable matching that minimises the worst rank any agent gets.
+
+        Starting from the company-optimal matching, while the worst-off agents
+        are all candidates, the rotations that move them up (with their
+        predecessors) are forced into every matching with a smaller regret.
+        The search stops once a company is worst off, since companies only
+        lose from here, and returns the best matching seen on the way.
+
+        Returns (candidate_match, regret).
+        """
+        # lifts[(k, c)]: rotation that moves candidate k away from company c
+        lifts = {}
+        for index, rotation in enumerate(self.rotations):
+            for company, candidate in rotation:
+                lifts[(candidate, company)] = index
+
+        candidate_match = list(self.company_optimal)
+        included = set()
+        best = None
+        while True:
+            regret = 0
+            worst_candidates = []
+            company_worst = False
+            for candidate, company in enumerate(candidate_match):
+                company_side = self.company_rank[company][candidate]
+                candidate_side = self.candidate_rank[candidate][company]
+                if max(company_side, candidate_side) > regret:
+                    regret = max(company_side, candidate_side)
+                    worst_candidates = []
+                    company_worst = False
+                if company_side == regret:
+                    company_worst = True
+                if candidate_side == regret:
+                    worst_candidates.append(candidate)
+
+            if best is None or regret < best[1]:
+                best = (list(candidate_match), regret)
+            if company_worst:
+                return best
+
+            forced = []
+            for candidate in worst_candidates:
+                index = lifts.get((candidate, candidate_match[candidate]))
+                if index is None:
+                    return best  # Already at their best stable partner
+                forced.append(index)
+
+            # Close the forced rotations under their predecessors
+            pending = [index for index in forced if index not in included]
+            closure = set()
+            while pending:
+                index = pending.pop()
+                if index in closure or index in included:
+                    continue
+                closure.add(index)
+                pending.extend(self.predecessors[index])
+            for index in sorted(closure):
+                self._apply(candidate_match, index)
+            included |= closure
+
+
+class _FlowNetwork:
+    """Small Dinic max-flow used for the egalitarian min cut."""
+
+    def __init__(self, size):
+        self.size = size
+        self.adjacency = [[] for _ in range(size)]
+        # Edges stored as parallel lists: target, residual capacity
+        self.target = []
+        self.capacity = []
+
+    def add_edge(self, u, v, capacity):
+        self.adjacency[u].append(len(self.target))
+        self.target.append(v)
+        self.capacity.append(capacity)
+        self.adjacency[v].append(len(self.target))
+        self.target.append(u)
+        self.capacity.append(0)
+
+    def _levels(self, source, sink):
+        level = [-1] * self.size
+        level[source] = 0
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for edge in self.adjacency[u]:
+                v = self.target[edge]
+                if self.capacity[edge] > 0 and level[v] < 0:
+                    level[v] = level[u] + 1
+                    queue.append(v)
+        return level if level[sink] >= 0 else None
+
+    def max_flow(self, source, sink):
+        flow = 0
+        while True:
+            level = self._levels(source, sink)
+            if level is None:
+                return flow
+            pointer = [0] * self.size
+            while True:
+                pushed = self._augment(source, sink, level, pointer)
+                if not pushed:
+                    break
+                flow += pushed
+
+    def _augment(self, source, sink, level, pointer):
+        # Iterative DFS along the level graph; returns the flow pushed
+        path = []
+        u = source
+        while True:
+            if u == sink:
+                pushed = min(self.capacity[edge] for edge in path)
+                for edge in path:
+                    self.capacity[edge] -= pushed
+                    self.capacity[edge ^ 1] += pushed
+                return pushed
+            edges = self.adjacency[u]
+            while pointer[u] < len(edges):
+                edge = edges[pointer[u]]
+                v = self.target[edge]
+                if self.capacity[edge] > 0 and level[v] == level[u] + 1:
+                    break
+                pointer[u] += 1
+            else:
+                if not path:
+                    return 0
+                # Dead end: retreat and skip the edge that led here
+                edge = path.pop()
+                u = self.target[edge ^ 1]
+                pointer[u] += 1
+                continue
+            path.append(edges[pointer[u]])
+            u = self.target[edges[pointer[u]]]
+
+    def reachable(self, source):
+        seen = {source}
+        queue = deque([source])
+        while queue:
+            u = queue.popleft()
+            for edge in self.adjacency[u]:
+                v = self.target[edge]
+                if self.capacity[edge] > 0 and v not in seen:
+                    seen.add(v)
+                    queue.append(v)
+        return seen
+
+
+if __name__ == '__main__':
+    # Sample input 0 from the readme
+    company_prefs = [[2, 1, 0], [1, 2, 0], [0, 1, 2]]
+    candidate_prefs = [[0, 1, 2], [1, 0, 2], [2, 0, 1]]
+
+    lattice = StableLattice(company_prefs, candidate_prefs)
+    print(f"{len(lattice.rotations)} rotation(s): {lattice.rotations}")
+    for candidate_match in lattice.matchings():
+        print(candidate_match, "cost", lattice.cost(candidate_match))
+    print("Egalitarian:", lattice.egalitarian())
+    print("Minimum regret:", lattice.minimum_regret())
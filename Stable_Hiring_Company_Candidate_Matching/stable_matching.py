@@ -5,44 +5,81 @@ import os
 import random
 import re
 import sys
+from array import array
+from collections import deque
 
 
+def stable_match(company_prefs, candidate_prefs):
+    """
+    Company-proposing Gale-Shapley matching in O(n^2).
 
-if __name__ == '__main__':
-    n = int(input().strip())
-
-    company_prefs = []
-
-    for _ in range(n):
-        company_prefs.append(list(map(int, input().rstrip().split())))
+    candidate_prefs is inverted into a candidate x company rank table, so
+    comparing two offers is an O(1) lookup instead of two list.index() scans,
+    and free companies are kept in a deque. A candidate's rank row is built
+    the first time that candidate has to compare two offers, so candidates
+    who are never contested are never read. This keeps memory-mapped
+    preference files (see preference_format.py) mostly on disk.
 
-    candidate_prefs = []
+    Returns candidate_match, where candidate_match[candidate] is the company
+    that hires that candidate.
+    """
+    n = len(company_prefs)
+    typecode = 'h' if n <= 2 ** 15 else 'i'
 
-    for _ in range(n):
-        candidate_prefs.append(list(map(int, input().rstrip().split())))
+    # rank[candidate][company] = position of company in candidate's list
+    rank = [None] * n
 
-    # Write your code here
     candidate_match = [-1] * n
     next_proposal_index = [0] * n
-    free_companies = list(range(n))
-    
+    free_companies = deque(range(n))
+
     while free_companies:
-        company = free_companies[0]
+        company = free_companies.popleft()
         candidate = company_prefs[company][next_proposal_index[company]]
         next_proposal_index[company] += 1
-        
+
         if candidate_match[candidate] == -1:
             candidate_match[candidate] = company
-            free_companies.pop(0)
         else:
             current_company = candidate_match[candidate]
-            current_rank = candidate_prefs[candidate].index(current_company)
-            new_rank = candidate_prefs[candidate].index(company)
-            
-            if new_rank < current_rank:
+            candidate_rank = rank[candidate]
+            if candidate_rank is None:
+                candidate_rank = rank[candidate] = array(typecode, [0]) * n
+                for position, preferred in enumerate(candidate_prefs[candidate]):
+                    candidate_rank[preferred] = position
+
+            if candidate_rank[company] < candidate_rank[current_company]:
                 candidate_match[candidate] = company
-                free_companies.pop(0)
                 free_companies.append(current_company)
-    
+            else:
+                # Rejected companies keep proposing first, as before
+                free_companies.appendleft(company)
+
+    return candidate_match
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1:
+        # Binary preference file written by preference_format.py
+        from preference_format import PreferenceFile
+
+        with PreferenceFile(sys.argv[1]) as prefs:
+            n = prefs.n
+            candidate_match = stable_match(prefs.company_prefs, prefs.candidate_prefs)
+    else:
+        n = int(input().strip())
+
+        company_prefs = []
+
+        for _ in range(n):
+            company_prefs.append(list(map(int, input().rstrip().split())))
+
+        candidate_prefs = []
+
+        for _ in range(n):
+            candidate_prefs.append(list(map(int, input().rstrip().split())))
+
+        candidate_match = stable_match(company_prefs, candidate_prefs)
+
     for candidate in range(n):
-        print(candidate, candidate_match[candidate])
\ No newline at end of file
+        print(candidate, candidate_match[candidate])
@@ -0,0 +1,219 @@
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import random
+import sys
+import timeit
+from collections import namedtuple
+
+import numpy as np
+
+from time_complexity_calculator import ComplexityEstimator
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Complexity classes from best to worst, as ComplexityEstimator names them
+COMPLEXITY_ORDER = list(ComplexityEstimator().complexity_patterns)
+
+# name: what is timed; claimed: the complexity documented for it;
+# sizes: input sizes n; prepare(n) builds a fresh input outside the timed
+# region and returns the zero-argument call to time
+Case = namedtuple('Case', ['name', 'claimed', 'sizes', 'prepare'])
+
+
+def load_function(folder: str, filename: str, name: str):
+    """
+    Import name from a module in another folder of the repository.
+
+    Each folder is a set of scripts that import each other by plain name, so
+    the folder goes on sys.path. The module itself is loaded under a name
+    that includes the folder, because several folders have a solution.py.
+    """
+    path = os.path.join(REPO_ROOT, folder, filename)
+    folder_path = os.path.dirname(path)
+    if folder_path not in sys.path:
+        sys.path.insert(0, folder_path)
+    module_name = f"{folder}.{filename[:-3]}".replace('-', '_')
+    module = sys.modules.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+    return getattr(module, name)
+
+
+def prepare_inversions(n):
+    countInversions = load_function('Counting_Inversions', 'counting_inversions.py', 'countInversions')
+    rng = random.Random(n)
+    A = list(range(n))
+    B = list(range(n))
+    rng.shuffle(A)
+    rng.shuffle(B)
+    return lambda: countInversions(A, B, n)
+
+
+def prepare_k_closest(n):
+    k_closest = load_function('Divide_and_Conquer', 'solution.py', 'k_closest')
+    rng = random.Random(n)
+    points = [[rng.randint(-10 ** 4, 10 ** 4), rng.randint(-10 ** 4, 10 ** 4)] for _ in range(n)]
+    return lambda: k_closest(points, 10)
+
+
+def prepare_stable_match(n):
+    stable_match = load_function('Stable_Hiring_Company_Candidate_Matching', 'stable_matching.py',
+                                 'stable_match')
+    # Identical company lists force about n^2 / 2 proposals, the worst case
+    rng = random.Random(n)
+    order = list(range(n))
+    company_prefs = [order] * n
+    candidate_prefs = []
+    for _ in range(n):
+        prefs = order[:]
+        rng.shuffle(prefs)
+        candidate_prefs.append(prefs)
+    return lambda: stable_match(company_prefs, candidate_prefs)
+
+
+def prepare_interval_scheduling(n):
+    max_non_overlapping = load_function('Maximum_Non-Overlapping', 'solution.py', 'max_non_overlapping')
+    rng = random.Random(n)
+    tasks = []
+    for _ in range(n):
+        start = rng.randint(1, 10 ** 9 - 1000)
+        tasks.append([start, start + rng.randint(0, 1000)])
+    # max_non_overlapping sorts in place, so every timed call gets its own list
+    return lambda: max_non_overlapping(tasks)
+
+
+def prepare_coin_distribution(n, calls=2000):
+    distribute_coins = load_function('BFS_DFS', 'task3_coin_distribution.py', 'distribute_coins')
+    make_change = load_function('BFS_DFS', 'task3_coin_distribution.py', 'make_change')
+    # n is the amount in cents; distinct amounts and a cleared cache make
+    # every call compute its change
+    make_change.cache_clear()
+    amounts = [n + i for i in range(calls)]
+
+    def run():
+        for amount in amounts:
+            distribute_coins(amount, 1)
+    return run
+
+
+def prepare_task_distribution(n, num_servers=1000):
+    LoadBalancer = load_function('Greedy_Algorithms', 'task4_server_load_balancing.py', 'LoadBalancer')
+    rng = random.Random(n)
+    balancer = LoadBalancer()
+    for i in range(num_servers):
+        balancer.add_server(f"S{i}", 10 ** 12)
+    tasks = {f"T{i}": rng.randint(1, 100) for i in range(n)}
+    return lambda: balancer.distribute_tasks(tasks)
+
+
+CASES = [
+    # Counting_Inversions/readme: O(N log N)
+    Case('countInversions', 'O(n log n)', [2 ** i for i in range(12, 18)], prepare_inversions),
+    # Divide-and-conquer merge sort by distance, then the first k
+    Case('k_closest', 'O(n log n)', [2 ** i for i in range(12, 18)], prepare_k_closest),
+    # Stable_Hiring_Company_Candidate_Matching/readme: O(n^2) on n x n lists
+    Case('stable_match', 'O(n^2)', [100 * 2 ** i for i in range(5)], prepare_stable_match),
+    # Earliest-finish greedy after one sort
+    Case('max_non_overlapping', 'O(n log n)', [2 ** i for i in range(13, 19)],
+         prepare_interval_scheduling),
+    # BFS_DFS/readme: greedy change is O(d) for a fixed coin system, whatever the amount
+    Case('distribute_coins', 'O(1)', [10 ** i for i in range(3, 10)], prepare_coin_distribution),
+    # Greedy_Algorithms/readme: O(T log S) for T tasks over a fixed fleet
+    Case('LoadBalancer.distribute_tasks', 'O(n log n)', [2 ** i for i in range(11, 17)],
+         prepare_task_distribution),
+]
+
+
+def measure(prepare, n: int, repeats: int = 3) -> float:
+    """
+    Best time in seconds over repeats calls on size n. Inputs are built
+    before the timer starts, and timeit turns the garbage collector off
+    while it runs.
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        call = prepare(n)
+        best = min(best, timeit.Timer(call).timeit(number=1))
+        del call
+        gc.collect()
+    return best
+
+
+def classify(sizes, times) -> str:
+    """Complexity class ComplexityEstimator assigns to (n, seconds) pairs."""
+    lines = "\n".join(f"{n} {t:.9f}" for n, t in zip(sizes, times))
+    # The 2^n pattern overflows for large n and is skipped; keep that quiet
+    with np.errstate(over='ignore', invalid='ignore'):
+        return ComplexityEstimator().estimate_complexity(lines)
+
+
+def is_worse(measured: str, claimed: str) -> bool:
+    """True if measured is a slower-growing class than claimed."""
+    return COMPLEXITY_ORDER.index(measured) > COMPLEXITY_ORDER.index(claimed)
+
+
+def run_case(case: Case, repeats: int = 3) -> dict:
+    """Time one case at every size and compare its class with the claim."""
+    times = [measure(case.prepare, n, repeats) for n in case.sizes]
+    measured = classify(case.sizes, times)
+    return {
+        'name': case.name,
+        'claimed': case.claimed,
+        'measured': measured,
+        'passed': not is_worse(measured, case.claimed),
+        'sizes': case.sizes,
+        'seconds': times,
+    }
+
+
+def run_suite(cases=CASES, repeats: int = 3, log=None) -> dict:
+    """
+    Run every case and collect a report. The suite passes when no measured
+    class is worse than its documented one; better is fine, since a fast
+    O(n log n) routine often measures as O(n).
+    """
+    results = []
+    for case in cases:
+        result = run_case(case, repeats)
+        results.append(result)
+        if log is not None:
+            status = 'ok' if result['passed'] else 'WORSE'
+            print(f"{case.name:<32} {case.claimed:<12} {result['measured']:<12} {status}", file=log)
+    return {
+        'python': sys.version.split()[0],
+        'repeats': repeats,
+        'passed': all(result['passed'] for result in results),
+        'cases': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check measured complexities against documented ones.")
+    parser.add_argument('--output', help="write the JSON report to this file instead of stdout")
+    parser.add_argument('--repeats', type=int, default=3, help="timed runs per size; the best is kept")
+    parser.add_argument('--cases', nargs='+', choices=[case.name for case in CASES],
+                        help="run only these cases")
+    args = parser.parse_args()
+
+    cases = [case for case in CASES if args.cases is None or case.name in args.cases]
+    print(f"{'Case':<32} {'Documented':<12} {'Measured':<12} Status", file=sys.stderr)
+    print("-" * 68, file=sys.stderr)
+    report = run_suite(cases, args.repeats, log=sys.stderr)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    sys.exit(0 if report['passed'] else 1)
+
+
+if __name__ == "__main__":
+    main()
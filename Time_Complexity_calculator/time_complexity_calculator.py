@@ -12,7 +12,9 @@ class ComplexityEstimator:
             'O(n^2)': (lambda n: n**2, 2),
             'O(n^3)': (lambda n: n**3, 3),
             'O(2^n)': (lambda n: 2**n, float('inf')),
-            'O(n!)': (lambda n: np.array([factorial(int(x)) for x in n]), float('inf'))
+            # n! overflows a float past 170; those sizes are skipped as non-finite
+            'O(n!)': (lambda n: np.array([factorial(int(x)) if x <= 170 else float('inf') for x in n],
+                                         dtype=float), float('inf'))
         }
 
     # Previous methods remain the same until find_best_fit